@@ -93,6 +93,10 @@ echo %BLUE%Building executable...%RESET%
 if exist "%BUILD_DIR%" rmdir /s /q "%BUILD_DIR%" 2>nul
 if exist "%DIST_DIR%" rmdir /s /q "%DIST_DIR%" 2>nul
 
+REM Precompile bytecode with docstrings/asserts stripped so PyInstaller
+REM packs ready-to-load .pyc files instead of recompiling at bundle time
+python -m compileall -o 2 -q src\voiceperio
+
 pyinstaller "%SPEC_FILE%" --noconfirm --log-level WARN
 if errorlevel 1 (
     echo %RED%Build failed%RESET%
@@ -1,4 +1,9 @@
-"""Convert PNG to ICO for PyInstaller"""
+"""Convert PNG to ICO for PyInstaller
+
+For faster builds, stock Pillow can be swapped for pillow-simd
+(pip uninstall pillow && pip install pillow-simd), which vectorizes the
+Lanczos resize kernels used here - same API, no code changes needed.
+"""
 from PIL import Image
 import os
 
@@ -6,15 +11,39 @@ import os
 png_path = "src/voiceperio/gui/resources/voiceperio.png"
 ico_path = "src/voiceperio/gui/resources/icon.ico"
 
+# Skip the conversion entirely when the ICO is already up to date -
+# repeated dev/CI builds shouldn't re-run six Lanczos resizes
+if os.path.exists(ico_path) and os.path.getmtime(ico_path) >= os.path.getmtime(png_path):
+    print(f"[OK] Icon up to date: {ico_path}")
+    raise SystemExit(0)
+
 print("Converting PNG to ICO...")
 
 try:
-    # Open and convert image
-    img = Image.open(png_path)
-    
-    # Create ICO with multiple sizes
+    # Open and convert to RGBA once, so each resize target doesn't
+    # repeat the mode conversion internally
+    img = Image.open(png_path).convert('RGBA')
+
+    # Create ICO with multiple sizes (largest first). Each frame is
+    # resized from the previous (larger) one rather than from the
+    # original, so the Lanczos kernels see ~1.3x the source pixels in
+    # total instead of 6x.
     sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
-    img.save(ico_path, format='ICO', sizes=sizes)
+    frames = [img.resize(sizes[0], Image.LANCZOS)]
+    for size in sizes[1:]:
+        frames.append(frames[-1].resize(size, Image.LANCZOS))
+
+    # Palette-quantize the small frames: at <=48px a 256-color palette is
+    # visually identical and 3-4x smaller on disk. FASTOCTREE is the only
+    # quantizer that keeps the alpha channel.
+    frames = [
+        frame.quantize(colors=256, method=Image.FASTOCTREE)
+        if frame.width <= 48 else frame
+        for frame in frames
+    ]
+
+    frames[0].save(ico_path, format='ICO',
+                   append_images=frames[1:], sizes=sizes)
     
     print(f"[OK] Created icon at: {ico_path}")
     print(f"     File size: {os.path.getsize(ico_path)} bytes")
@@ -16,6 +16,8 @@ Features:
 """
 
 from typing import List, Optional, Dict, Tuple, Any
+from functools import lru_cache
+import ctypes
 import pyautogui
 import win32gui
 import win32con
@@ -26,6 +28,88 @@ from .utils import window_utils
 logger = logging.getLogger(__name__)
 
 
+# ==================== WIN32 SENDINPUT PLUMBING ====================
+# Used by the batched fast path (_send_inputs_batch): a whole key
+# sequence is submitted as one contiguous INPUT array in a single
+# user32.SendInput call instead of one pyautogui call per key.
+
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    # Only present so the INPUT union has the correct Win32 size
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("union", _INPUTUNION)]
+
+
+@lru_cache(maxsize=256)
+def _map_keystroke_cached(key: str) -> str:
+    """Map a keystroke name to its pyautogui equivalent, memoized.
+
+    Keys come from a tiny fixed vocabulary, so the lowercase/strip/split
+    work only ever runs once per distinct string.
+    """
+    key_lower = key.lower().strip()
+
+    # Check if it's already a valid pyautogui key
+    if key_lower in ActionExecutor.KEYSTROKE_MAP:
+        return ActionExecutor.KEYSTROKE_MAP[key_lower]
+
+    # Check for key combinations
+    if '+' in key_lower:
+        parts = [p.strip() for p in key_lower.split('+')]
+        return '+'.join(ActionExecutor.KEYSTROKE_MAP.get(p, p) for p in parts)
+
+    # Return as-is if not found (pyautogui might handle it)
+    return key_lower
+
+
+@lru_cache(maxsize=128)
+def _combo_parts(mapped_key: str) -> Tuple[str, ...]:
+    """Split a mapped combo string once and cache the tuple for hotkey()."""
+    return tuple(mapped_key.split('+'))
+
+
+def _busy_sleep(duration: float) -> None:
+    """Sleep accurately even below Windows' ~15.6ms timer granularity.
+
+    time.sleep rounds sub-16ms waits up to a full timer tick; for short
+    pauses we spin on perf_counter instead so low keystroke delays pace
+    as configured.
+    """
+    if duration >= 0.002:
+        time.sleep(duration)
+        return
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        pass
+
+
 class ActionExecutor:
     """
     Sends keystrokes to target window.
@@ -120,6 +204,12 @@ class ActionExecutor:
         '~': 'shift+grave',
     }
     
+    # Pre-split combo tuples for SPECIAL_CHARS, populated right after the
+    # class body (class-scope comprehensions can't see SPECIAL_CHARS), so
+    # type_special_character hands hotkey() a ready tuple instead of
+    # re-parsing the combo string per call
+    SPECIAL_CHARS_COMBOS: Dict[str, Tuple[str, ...]]
+
     # Numpad key names for pyautogui (used by type_perio_number)
     NUMPAD_DIGIT_KEYS: Dict[str, str] = {
         '0': 'num0', '1': 'num1', '2': 'num2', '3': 'num3', '4': 'num4',
@@ -127,6 +217,36 @@ class ActionExecutor:
     }
     NUMPAD_MINUS_KEY: str = 'subtract'  # Numpad minus / subtract key
 
+    # Virtual-key sequences matching the Dentrix numpad protocol used by
+    # type_perio_number: numpad digit for 0-9, numpad minus + units digit
+    # for 10-19 (VK_NUMPAD0=0x60, VK_SUBTRACT=0x6D)
+    _NUMBER_VK_SEQ: Dict[int, Tuple[int, ...]] = {
+        n: (0x60 + n,) if n < 10 else (0x6D, 0x60 + n - 10)
+        for n in range(20)
+    }
+
+    # Valid perio values as a frozenset: membership is one C-level hash
+    # lookup replacing the range branches. Callers still need an exact
+    # int type check first - bools and whole floats (True, 5.0) hash
+    # equal to their int values and would slip through the set alone
+    _VALID_PERIO = frozenset(range(20))
+
+    # Virtual-key codes for the separators the batched path supports
+    _SEPARATOR_VK: Dict[str, int] = {'tab': 0x09, 'enter': 0x0D, 'space': 0x20}
+
+    # Virtual-key codes for combos sent through the batched SendInput
+    # path; keys missing here fall back to pyautogui.hotkey
+    _VK_MAP: Dict[str, int] = {
+        'ctrl': 0x11, 'shift': 0x10, 'alt': 0x12,
+        'tab': 0x09, 'enter': 0x0D, 'esc': 0x1B, 'space': 0x20,
+        'backspace': 0x08, 'delete': 0x2E, 'insert': 0x2D,
+        'home': 0x24, 'end': 0x23, 'pageup': 0x21, 'pagedown': 0x22,
+        'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
+        **{chr(c): c - 0x20 for c in range(ord('a'), ord('z') + 1)},
+        **{str(d): 0x30 + d for d in range(10)},
+        **{'f%d' % i: 0x6F + i for i in range(1, 13)},
+    }
+
     def __init__(
         self,
         target_window_title: Optional[str] = None,
@@ -142,12 +262,48 @@ class ActionExecutor:
         self.target_window_handle: Optional[int] = None
         self.target_window_title = target_window_title
         self.keystroke_delay = keystroke_delay_ms / 1000.0  # Convert to seconds
+
+        # Recent title-pattern lookups: pattern -> (hwnd, timestamp).
+        # Lets repeat find_target_window calls during a charting session
+        # skip the full window enumeration.
+        self._hwnd_cache: Dict[str, Tuple[int, float]] = {}
+
+        # Last GetForegroundWindow result: (hwnd, timestamp). Focus is
+        # polled between speech events, so a ~50ms reuse window saves a
+        # Win32 round-trip per poll without noticeable staleness.
+        self._fg_cache: Tuple[int, float] = (0, 0.0)
         
         # Disable pyautogui failsafe for production use
         pyautogui.FAILSAFE = False
-        
+
+        # pyautogui defaults to a 100ms pause after every call, which
+        # adds seconds of idle across a perio sequence; inter-keystroke
+        # timing is governed entirely by self.keystroke_delay
+        pyautogui.PAUSE = 0
+
+        # Raise the system timer resolution to 1ms so time.sleep paces
+        # keystrokes as configured instead of rounding to Windows'
+        # ~15.6ms tick. Process-global; released again in close().
+        try:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+            self._timer_period_raised = True
+        except (AttributeError, OSError):
+            self._timer_period_raised = False
+
         logger.info(f"ActionExecutor initialized with delay: {keystroke_delay_ms}ms")
-    
+
+    def close(self) -> None:
+        """Release the raised timer resolution. Safe to call repeatedly."""
+        if getattr(self, '_timer_period_raised', False):
+            try:
+                ctypes.windll.winmm.timeEndPeriod(1)
+            except (AttributeError, OSError):
+                pass
+            self._timer_period_raised = False
+
+    def __del__(self):
+        self.close()
+
     # ==================== WINDOW FINDING & MANAGEMENT ====================
     
     def find_target_window(self, title_pattern: str) -> bool:
@@ -168,12 +324,25 @@ class ActionExecutor:
         if not title_pattern:
             logger.error("Title pattern cannot be empty")
             return False
-        
+
         try:
+            # Reuse a recent lookup if the window is still alive, so
+            # repeat calls skip the O(N windows) enumeration
+            pattern_key = title_pattern.lower()
+            cached = self._hwnd_cache.get(pattern_key)
+            if cached is not None:
+                hwnd, ts = cached
+                if time.monotonic() - ts < 2.0 and win32gui.IsWindow(hwnd):
+                    self.target_window_handle = hwnd
+                    self.target_window_title = title_pattern
+                    return True
+                del self._hwnd_cache[pattern_key]
+
             self.target_window_handle = window_utils.find_window_by_title(title_pattern)
-            
+
             if self.target_window_handle:
                 self.target_window_title = title_pattern
+                self._hwnd_cache[pattern_key] = (self.target_window_handle, time.monotonic())
                 logger.info(f"Found target window: {title_pattern} (hwnd={self.target_window_handle})")
                 return True
             else:
@@ -200,9 +369,16 @@ class ActionExecutor:
             return False
         
         try:
-            return window_utils.focus_window(self.target_window_handle, activate=True)
+            # Focus is changing; the cached foreground window is stale
+            self._fg_cache = (0, 0.0)
+            focused = window_utils.focus_window(self.target_window_handle, activate=True)
+            if not focused:
+                # Handle may be stale; force the next lookup to re-enumerate
+                self._hwnd_cache.clear()
+            return focused
         except Exception as e:
             logger.error(f"Error focusing window: {e}")
+            self._hwnd_cache.clear()
             return False
     
     def get_target_window_info(self) -> Optional[Dict[str, Any]]:
@@ -244,9 +420,15 @@ class ActionExecutor:
         if not self.target_window_handle:
             logger.debug("Cannot check focus: no target window set")
             return False
-        
+
         try:
-            return window_utils.is_window_focused(self.target_window_handle)
+            hwnd, ts = self._fg_cache
+            if time.monotonic() - ts < 0.05:
+                return hwnd == self.target_window_handle
+
+            fg_hwnd = win32gui.GetForegroundWindow()
+            self._fg_cache = (fg_hwnd, time.monotonic())
+            return fg_hwnd == self.target_window_handle
         except Exception as e:
             logger.error(f"Error checking target window focus: {e}")
             return False
@@ -264,34 +446,19 @@ class ActionExecutor:
             >>> executor.set_keystroke_delay(100)  # 100ms between keys
         """
         self.keystroke_delay = delay_ms / 1000.0
-        logger.debug(f"Keystroke delay set to {delay_ms}ms")
+        logger.debug("Keystroke delay set to %sms", delay_ms)
     
     def _map_keystroke(self, key: str) -> str:
         """
         Map a keystroke name to pyautogui equivalent.
-        
+
         Args:
             key: Key name (e.g., 'enter', 'tab', 'ctrl+s')
-            
+
         Returns:
             Mapped key name for pyautogui
         """
-        key_lower = key.lower().strip()
-        
-        # Check if it's already a valid pyautogui key
-        if key_lower in self.KEYSTROKE_MAP:
-            return self.KEYSTROKE_MAP[key_lower]
-        
-        # Check for key combinations
-        if '+' in key_lower:
-            parts = [p.strip() for p in key_lower.split('+')]
-            mapped_parts = []
-            for part in parts:
-                mapped_parts.append(self.KEYSTROKE_MAP.get(part, part))
-            return '+'.join(mapped_parts)
-        
-        # Return as-is if not found (pyautogui might handle it)
-        return key_lower
+        return _map_keystroke_cached(key)
     
     def send_keystroke(self, key: str) -> bool:
         """
@@ -315,14 +482,13 @@ class ActionExecutor:
             mapped_key = self._map_keystroke(key)
             
             if '+' in mapped_key:
-                # Key combination
-                parts = mapped_key.split('+')
-                pyautogui.hotkey(*parts)
+                # Key combination (split is cached per distinct combo)
+                pyautogui.hotkey(*_combo_parts(mapped_key))
             else:
                 # Single key
                 pyautogui.press(mapped_key)
             
-            logger.debug(f"Sent keystroke: {key} (mapped: {mapped_key})")
+            logger.debug("Sent keystroke: %s (mapped: %s)", key, mapped_key)
             return True
         
         except Exception as e:
@@ -349,13 +515,55 @@ class ActionExecutor:
         
         try:
             mapped_keys = [self._map_keystroke(k) for k in keys]
+
+            # Fast path: known keys go out as one SendInput (KEYDOWNs in
+            # order, KEYUPs in reverse) instead of pyautogui.hotkey's
+            # per-key injection and modifier-state probing
+            vk_codes = [self._VK_MAP.get(k) for k in mapped_keys]
+            if all(vk is not None for vk in vk_codes):
+                if self._send_combo_batch(vk_codes):
+                    logger.debug("Sent key combo (batched): %s", '+'.join(keys))
+                    return True
+                # Injection fell short; fall through to pyautogui
+
             pyautogui.hotkey(*mapped_keys)
-            logger.debug(f"Sent key combo: {'+'.join(keys)}")
+            logger.debug("Sent key combo: %s", '+'.join(keys))
             return True
-        
+
         except Exception as e:
             logger.error(f"Error sending key combo {keys}: {e}")
             return False
+
+    def _send_combo_batch(self, vk_codes: List[int]) -> bool:
+        """
+        Send a key combination as a single SendInput call.
+
+        Emits KEYDOWN events in order followed by KEYUP events in
+        reverse, so e.g. ctrl+s arrives as one injected batch.
+
+        Args:
+            vk_codes: Virtual-key codes, modifiers first
+
+        Returns:
+            True if every event was injected, False otherwise
+        """
+        count = len(vk_codes) * 2
+        inputs = (_INPUT * count)()
+        for i, vk in enumerate(vk_codes):
+            down = inputs[i]
+            down.type = _INPUT_KEYBOARD
+            down.union.ki.wVk = vk
+        for i, vk in enumerate(reversed(vk_codes)):
+            up = inputs[len(vk_codes) + i]
+            up.type = _INPUT_KEYBOARD
+            up.union.ki.wVk = vk
+            up.union.ki.dwFlags = _KEYEVENTF_KEYUP
+
+        sent = ctypes.windll.user32.SendInput(count, inputs, ctypes.sizeof(_INPUT))
+        if sent != count:
+            logger.warning(f"SendInput injected {sent}/{count} combo events")
+            return False
+        return True
     
     # ==================== TEXT TYPING ====================
     
@@ -379,7 +587,7 @@ class ActionExecutor:
         try:
             # Use pyautogui with the configured delay
             pyautogui.typewrite(text, interval=self.keystroke_delay)
-            logger.debug(f"Typed text: '{text}'")
+            logger.debug("Typed text: '%s'", text)
             return True
         
         except Exception as e:
@@ -400,13 +608,22 @@ class ActionExecutor:
             >>> executor.type_special_character('@')
             >>> executor.type_special_character('&')
         """
-        if char in self.SPECIAL_CHARS:
-            return self.send_keystroke(self.SPECIAL_CHARS[char])
+        combo = self.SPECIAL_CHARS_COMBOS.get(char)
+        if combo is not None:
+            # Pre-split tuple goes straight to hotkey, skipping the
+            # combo-string parse in send_keystroke
+            try:
+                pyautogui.hotkey(*combo)
+                logger.debug("Typed special character: '%s'", char)
+                return True
+            except Exception as e:
+                logger.error(f"Error typing special character '{char}': {e}")
+                return False
         else:
             # Try to type it directly
             try:
                 pyautogui.write(char)
-                logger.debug(f"Typed special character: '{char}'")
+                logger.debug("Typed special character: '%s'", char)
                 return True
             except Exception as e:
                 logger.error(f"Error typing special character '{char}': {e}")
@@ -432,17 +649,23 @@ class ActionExecutor:
             >>> executor.type_number(3)
             >>> executor.type_number(15)
         """
-        if not isinstance(number, int):
-            logger.error(f"Number must be integer, got: {type(number)}")
-            return False
-        
-        if number < 0 or number > 19:
-            logger.error(f"Number must be 0-19 for perio charting, got: {number}")
+        if type(number) is not int or number not in self._VALID_PERIO:
+            logger.error(f"Number must be an integer 0-19 for perio charting, got: {number!r}")
             return False
-        
+
         try:
+            # Fast path: perio values are a closed set with precomputed
+            # VK sequences, so with no configured delay the whole value
+            # lands in one SendInput instead of pyautogui's per-key
+            # layout translation and pacing
+            if self.keystroke_delay <= 0.001:
+                if self._send_inputs_batch(list(self._NUMBER_VK_SEQ[number])):
+                    logger.debug("Typed perio number (batched): %s", number)
+                    return True
+                # Injection fell short; fall through to the paced path
+
             result = self.type_perio_number(str(number))
-            logger.debug(f"Typed perio number: {number}")
+            logger.debug("Typed perio number: %s", number)
             return result
         
         except Exception as e:
@@ -482,7 +705,7 @@ class ActionExecutor:
                 # Single digit — send the numpad digit key directly.
                 key = self.NUMPAD_DIGIT_KEYS[digits]
                 pyautogui.press(key)
-                logger.debug(f"type_perio_number: single digit '{digits}' -> pressed '{key}'")
+                logger.debug("type_perio_number: single digit '%s' -> pressed '%s'", digits, key)
                 return True
 
             if len(digits) == 2 and digits[0] == '1' and digits[1] in self.NUMPAD_DIGIT_KEYS:
@@ -497,7 +720,7 @@ class ActionExecutor:
                 return True
 
             # Fallback: multi-digit sequence or unrecognised format — use type_text.
-            logger.debug(f"type_perio_number: multi-digit '{digits}' -> falling back to type_text")
+            logger.debug("type_perio_number: multi-digit '%s' -> falling back to type_text", digits)
             return self.type_text(digits)
 
         except Exception as e:
@@ -505,7 +728,40 @@ class ActionExecutor:
             return False
 
     # ==================== NUMBER SEQUENCES ====================
-    
+
+    def _send_inputs_batch(self, vk_codes: List[int]) -> bool:
+        """
+        Send a sequence of virtual-key presses in one SendInput call.
+
+        Builds a contiguous INPUT array of KEYDOWN+KEYUP pairs and submits
+        it with a single user32.SendInput, avoiding pyautogui's per-key
+        modifier probing and per-event syscall. Only used when the
+        configured keystroke delay is effectively zero, since the batch
+        is injected with no inter-key pacing.
+
+        Args:
+            vk_codes: Virtual-key codes to press, in order
+
+        Returns:
+            True if every event was injected, False otherwise
+        """
+        count = len(vk_codes) * 2
+        inputs = (_INPUT * count)()
+        for i, vk in enumerate(vk_codes):
+            down = inputs[2 * i]
+            down.type = _INPUT_KEYBOARD
+            down.union.ki.wVk = vk
+            up = inputs[2 * i + 1]
+            up.type = _INPUT_KEYBOARD
+            up.union.ki.wVk = vk
+            up.union.ki.dwFlags = _KEYEVENTF_KEYUP
+
+        sent = ctypes.windll.user32.SendInput(count, inputs, ctypes.sizeof(_INPUT))
+        if sent != count:
+            logger.warning(f"SendInput injected {sent}/{count} events")
+            return False
+        return True
+
     def type_number_sequence(
         self,
         numbers: List[int],
@@ -538,13 +794,29 @@ class ActionExecutor:
             return True
         
         try:
-            # Validate all numbers first
-            for num in numbers:
-                if not isinstance(num, int):
-                    raise ValueError(f"All numbers must be integers, got: {type(num)}")
-                if num < 0 or num > 19:
-                    raise ValueError(f"Number must be 0-19, got: {num}")
-            
+            # Validate all numbers in one membership pre-pass
+            bad = [
+                num for num in numbers
+                if type(num) is not int or num not in self._VALID_PERIO
+            ]
+            if bad:
+                raise ValueError(f"Numbers must be integers 0-19, got: {bad}")
+
+            # Fast path: with no meaningful inter-key delay, inject the
+            # whole sequence (digits + separators) as one SendInput batch
+            # instead of a pyautogui call per key
+            separator_vk = self._SEPARATOR_VK.get(separator)
+            if self.keystroke_delay <= 0.001 and separator_vk is not None:
+                vk_codes: List[int] = []
+                for i, num in enumerate(numbers):
+                    vk_codes.extend(self._NUMBER_VK_SEQ[num])
+                    if i < len(numbers) - 1 or final_separator:
+                        vk_codes.append(separator_vk)
+                if self._send_inputs_batch(vk_codes):
+                    logger.info("Typed number sequence (batched): %s (separator: %s)", numbers, separator)
+                    return True
+                # Injection fell short; fall through to the per-key path
+
             # Type each number with separator
             for i, num in enumerate(numbers):
                 # Type the number
@@ -555,11 +827,13 @@ class ActionExecutor:
                 if i < len(numbers) - 1 or final_separator:
                     if not self.send_keystroke(separator):
                         return False
-                    
-                    # Small delay after separator
-                    time.sleep(self.keystroke_delay * 2)
+
+                    # Small delay after separator; skipped entirely when
+                    # no delay is configured
+                    if self.keystroke_delay > 0:
+                        _busy_sleep(self.keystroke_delay * 2)
             
-            logger.info(f"Typed number sequence: {numbers} (separator: {separator})")
+            logger.info("Typed number sequence: %s (separator: %s)", numbers, separator)
             return True
         
         except ValueError as e:
@@ -602,3 +876,9 @@ class ActionExecutor:
     def paste(self) -> bool:
         """Execute Ctrl+V (Paste)"""
         return self.send_key_combo(['ctrl', 'v'])
+
+
+ActionExecutor.SPECIAL_CHARS_COMBOS = {
+    char: tuple(combo.split('+'))
+    for char, combo in ActionExecutor.SPECIAL_CHARS.items()
+}
@@ -6,7 +6,10 @@ Handles audio capture from microphone using sounddevice
 import sounddevice as sd
 import numpy as np
 from typing import List, Dict, Optional
+import collections
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -43,17 +46,40 @@ class AudioCapture:
         self.device_id = None
         self.stream = None
         self.is_running = False
-        logger.debug(f"AudioCapture initialized: sample_rate={sample_rate}, chunk_size={chunk_size}")
+
+        # Chunks land here from the PortAudio callback thread; deque
+        # append/popleft are atomic so no lock is needed. maxlen bounds
+        # memory if the consumer stalls (oldest chunks are dropped).
+        self._ring = collections.deque(maxlen=32)
+        self._ring_event = threading.Event()
+
+        # query_devices() triggers a PortAudio host-API scan that can
+        # take tens of ms on Windows; cache the result briefly
+        self._devices_cache = None
+        self._devices_cache_ts = 0.0
+        logger.debug("AudioCapture initialized: sample_rate=%s, chunk_size=%s", sample_rate, chunk_size)
     
+    def _get_devices(self):
+        """Return the device table, refreshing the cache after 5 seconds."""
+        now = time.monotonic()
+        if self._devices_cache is None or now - self._devices_cache_ts > 5.0:
+            self._devices_cache = sd.query_devices()
+            self._devices_cache_ts = now
+        return self._devices_cache
+
+    def refresh_devices(self) -> None:
+        """Drop the cached device table (e.g. after a hot-plug event)."""
+        self._devices_cache = None
+
     def list_devices(self) -> List[Dict]:
         """
         List all available audio devices.
-        
+
         Returns:
             List of device dictionaries with id, name, and info
         """
         try:
-            devices = sd.query_devices()
+            devices = self._get_devices()
             device_list = []
             
             for idx, device in enumerate(devices):
@@ -64,7 +90,7 @@ class AudioCapture:
                     'sample_rate': device['default_samplerate']
                 }
                 device_list.append(device_dict)
-                logger.debug(f"Device {idx}: {device['name']} ({device['max_input_channels']} channels)")
+                logger.debug("Device %s: %s (%s channels)", idx, device['name'], device['max_input_channels'])
             
             logger.info(f"Found {len(device_list)} audio devices")
             return device_list
@@ -84,7 +110,7 @@ class AudioCapture:
             True if device is valid, False otherwise
         """
         try:
-            devices = sd.query_devices()
+            devices = self._get_devices()
             if 0 <= device_id < len(devices):
                 self.device_id = device_id
                 logger.info(f"Set audio device to {device_id}: {devices[device_id]['name']}")
@@ -108,12 +134,15 @@ class AudioCapture:
             return True
         
         try:
-            self.stream = sd.InputStream(
+            self._ring.clear()
+            self._ring_event.clear()
+            self.stream = sd.RawInputStream(
                 device=self.device_id,
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 blocksize=self.chunk_size,
-                dtype=np.int16
+                dtype='int16',
+                callback=self._on_audio
             )
             self.stream.start()
             self.is_running = True
@@ -141,6 +170,7 @@ class AudioCapture:
             self.stream.close()
             self.stream = None
             self.is_running = False
+            self._ring.clear()
             logger.info("Audio capture stream stopped")
             return True
         
@@ -148,30 +178,51 @@ class AudioCapture:
             logger.error(f"Error stopping audio stream: {e}")
             return False
     
-    def get_audio_chunk(self) -> Optional[bytes]:
+    def _on_audio(self, indata, frames, time_info, status) -> None:
+        """PortAudio callback: push raw int16 bytes onto the ring buffer.
+
+        Runs on the audio thread; must stay cheap. bytes(indata) is the
+        only copy the chunk ever takes on its way to Vosk.
         """
-        Get next audio chunk from stream.
-        
+        if status:
+            logger.warning(f"Audio stream status: {status}")
+        self._ring.append(bytes(indata))
+        self._ring_event.set()
+
+    def get_audio_chunk(self, timeout: float = 0.5) -> Optional[bytes]:
+        """
+        Get next audio chunk from the ring buffer.
+
+        The PortAudio callback fills the buffer from its own thread, so
+        this never blocks inside a C read call holding the GIL; it just
+        pops, or waits briefly for the callback to signal new data.
+
+        Args:
+            timeout: Seconds to wait for a chunk before returning None
+
         Returns:
-            Bytes of audio data or None if stream not running
-            
-        Raises:
-            RuntimeError: If stream is not running
+            Bytes of audio data (int16 for Vosk) or None if no chunk
+            arrived within the timeout or the stream is not running
         """
         if not self.is_running or not self.stream:
             return None
-        
+
         try:
-            # Read audio chunk from stream
-            audio_data, overflowed = self.stream.read(self.chunk_size)
-            
-            if overflowed:
-                logger.warning("Audio buffer overflow - some audio data was lost")
-            
-            # Convert numpy array to bytes (int16 format for Vosk)
-            audio_bytes = audio_data.astype(np.int16).tobytes()
-            return audio_bytes
-        
-        except Exception as e:
-            logger.error(f"Error reading audio chunk: {e}")
-            return None
+            return self._ring.popleft()
+        except IndexError:
+            pass
+
+        # Buffer empty: arm the event, re-check for a chunk that raced
+        # in, then wait for the callback
+        self._ring_event.clear()
+        try:
+            return self._ring.popleft()
+        except IndexError:
+            pass
+
+        if self._ring_event.wait(timeout):
+            try:
+                return self._ring.popleft()
+            except IndexError:
+                pass
+        return None
@@ -11,9 +11,8 @@ Modes:
 
 from __future__ import annotations
 
+import collections
 import logging
-import queue
-import re
 import sys
 import threading
 from typing import Optional
@@ -37,11 +36,20 @@ class AudioFeedbackManager:
         self.readback_rate = int(readback_rate)
         self.readback_max_chars = max(8, int(readback_max_chars))
 
-        self._speech_queue: "queue.Queue[str]" = queue.Queue(maxsize=6)
+        # Single producer (UI thread) / single consumer (speech worker):
+        # deque append/popleft are atomic under the GIL, so no Condition
+        # lock per message; maxlen drops the oldest entry on overflow.
+        self._speech_deque: "collections.deque[str]" = collections.deque(maxlen=6)
+        self._speech_event = threading.Event()
         self._speech_thread: Optional[threading.Thread] = None
         self._speech_running = False
         self._speech_available: Optional[bool] = None
 
+        # Pre-warm the SAPI worker so CoInitialize + Dispatch happen now,
+        # not on the first charted entry
+        if self.mode == "readback":
+            self._ensure_speech_worker()
+
     def update_settings(
         self,
         mode: Optional[str] = None,
@@ -57,6 +65,11 @@ class AudioFeedbackManager:
             if readback_max_chars is not None:
                 self.readback_max_chars = max(8, int(readback_max_chars))
 
+            if self.mode == "readback":
+                # Pre-warm SAPI off the charting hot path (no-op if the
+                # worker is already running)
+                self._ensure_speech_worker()
+
     def play_success(self, text: str) -> None:
         """Play success feedback based on current mode."""
         mode = self.mode
@@ -92,10 +105,7 @@ class AudioFeedbackManager:
             return
 
         self._speech_running = False
-        try:
-            self._speech_queue.put_nowait("")
-        except queue.Full:
-            pass
+        self._speech_event.set()
 
         if self._speech_thread.is_alive():
             self._speech_thread.join(timeout=1.0)
@@ -105,7 +115,9 @@ class AudioFeedbackManager:
         return mode_lower if mode_lower in self.VALID_MODES else "off"
 
     def _prepare_readback_text(self, text: str) -> str:
-        clean = re.sub(r"\s+", " ", (text or "").strip())
+        # str.split() collapses runs of whitespace (and strips) in C; no
+        # regex engine needed for these short readback strings
+        clean = " ".join((text or "").split())
         if not clean:
             return ""
 
@@ -156,20 +168,11 @@ class AudioFeedbackManager:
         if not self._ensure_speech_worker():
             return False
 
-        try:
-            self._speech_queue.put_nowait(text)
-            return True
-        except queue.Full:
-            try:
-                self._speech_queue.get_nowait()
-            except queue.Empty:
-                pass
-
-            try:
-                self._speech_queue.put_nowait(text)
-                return True
-            except queue.Full:
-                return False
+        # maxlen evicts the oldest pending readback on overflow, matching
+        # the old drop-oldest-then-put behavior without any locking
+        self._speech_deque.append(text)
+        self._speech_event.set()
+        return True
 
     def _ensure_speech_worker(self) -> bool:
         if self._speech_available is False:
@@ -209,18 +212,30 @@ class AudioFeedbackManager:
             logger.warning(f"Readback unavailable, falling back to chime: {exc}")
             return
 
+        # Track the last rate applied to the voice so the COM property set
+        # (a full Python->pywin32->COM roundtrip) only happens on change
+        last_rate: Optional[int] = None
+
         try:
             while self._speech_running:
+                if not self._speech_deque:
+                    self._speech_event.wait(0.25)
+                    self._speech_event.clear()
+                    continue
+
                 try:
-                    text = self._speech_queue.get(timeout=0.25)
-                except queue.Empty:
+                    text = self._speech_deque.popleft()
+                except IndexError:
                     continue
 
                 if not text:
                     continue
 
                 try:
-                    voice.Rate = int(self.readback_rate)
+                    rate = int(self.readback_rate)
+                    if rate != last_rate:
+                        voice.Rate = rate
+                        last_rate = rate
                     voice.Speak(text)
                 except Exception as exc:
                     logger.debug(f"Speech readback failed: {exc}")
@@ -3,10 +3,11 @@ Command Parser Module - Speech to command interpretation
 Converts recognized speech text to executable commands
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Callable, Optional, List, Dict, Any, Sequence, Tuple
 import json
 import logging
-from rapidfuzz import fuzz
+import sys
+from rapidfuzz import fuzz, process
 from difflib import SequenceMatcher
 
 
@@ -21,17 +22,21 @@ class Command:
         action: Type of action (e.g., "number_sequence", "keystroke", "indicator")
         params: Dictionary of command parameters
     """
-    
-    def __init__(self, action: str, **kwargs: Any) -> None:
+
+    __slots__ = ('action', 'params')
+
+    def __init__(self, action: str, params: Optional[Dict[str, Any]] = None,
+                 **kwargs: Any) -> None:
         """
         Initialize command.
-        
+
         Args:
             action: Type of action
-            **kwargs: Command parameters
+            params: Pre-built parameter dict (stored as-is, no copy)
+            **kwargs: Command parameters (alternative to params)
         """
         self.action: str = action
-        self.params: Dict[str, Any] = kwargs
+        self.params: Dict[str, Any] = params if params is not None else kwargs
     
     def __repr__(self) -> str:
         """Return string representation of command."""
@@ -65,7 +70,27 @@ class CommandParser:
         """
         self.commands_db: Dict[str, Any] = {}
         self.word_to_number: Dict[str, int] = {}
-        
+        self._number_words: frozenset = frozenset()
+
+        # Candidate tables precomputed by load_commands so the per-utterance
+        # path never walks the JSON schema: section -> (names_tuple,
+        # alias->canonical)
+        self._candidates: Dict[str, Tuple[Tuple[str, ...], Dict[str, str]]] = {}
+
+        # Flattened view of all four tables for the one-shot cdist scan:
+        # parallel tuples of candidate text and owning section key
+        self._all_candidates: Tuple[str, ...] = ()
+        self._candidate_owners: Tuple[str, ...] = ()
+
+        # Subparsers tried after the number-sequence branch, as (section,
+        # bound method) pairs so parse() avoids per-miss attribute lookups.
+        # Navigation is dispatched separately - it runs before numbers.
+        self._parsers: List[Tuple[str, Callable[[str, Optional[str]], Optional[Command]]]] = [
+            ('perio_indicators', self._parse_indicator),
+            ('actions', self._parse_action),
+            ('app_control', self._parse_app_control),
+        ]
+
         if commands_file:
             self.load_commands(commands_file)
     
@@ -89,13 +114,98 @@ class CommandParser:
             # Build word-to-number mapping
             if 'numbers' in self.commands_db:
                 self.word_to_number = self.commands_db['numbers']
-            
+            self._number_words = frozenset(self.word_to_number)
+
+            # Constant-fold the schema walk: build each section's candidate
+            # table once here instead of on every parse() call. Navigation
+            # excludes 'skip'/'skip_count' - those have special handling.
+            self._candidates = {
+                'navigation': self._build_candidates(
+                    'navigation', exclude=('skip', 'skip_count')
+                ),
+                'perio_indicators': self._build_candidates('perio_indicators'),
+                'actions': self._build_candidates('actions'),
+                'app_control': self._build_candidates('app_control'),
+            }
+
+            all_candidates: List[str] = []
+            owners: List[str] = []
+            for section, (names, _) in self._candidates.items():
+                all_candidates.extend(names)
+                owners.extend([section] * len(names))
+            self._all_candidates = tuple(all_candidates)
+            self._candidate_owners = tuple(owners)
+
             logger.info(f"Loaded commands from {filepath} with {len(self.word_to_number)} number mappings")
             return True
         except Exception as e:
             logger.error(f"Failed to load commands: {e}")
             return False
     
+    def _build_candidates(
+        self, section: str, exclude: Tuple[str, ...] = ()
+    ) -> Tuple[Tuple[str, ...], Dict[str, str]]:
+        """
+        Build the fuzzy-match candidate table for one commands_db section.
+
+        Args:
+            section: Section key in commands_db (e.g., 'perio_indicators')
+            exclude: Command names to leave out (e.g., specially-handled 'skip')
+
+        Returns:
+            Tuple of (candidate names as immutable tuple, alias->canonical map)
+
+        Candidates are lowercased here so they always compare against the
+        already-lowercased parse() text (mixed-case JSON entries would
+        otherwise silently miss the threshold), and interned so repeated
+        dict lookups reduce to pointer comparisons.
+        """
+        cand_map: Dict[str, str] = {}
+        for cmd_name, cmd_data in self.commands_db.get(section, {}).items():
+            # Sections carry "_comment" string entries alongside the real
+            # command dicts - they are documentation, not candidates
+            if cmd_name in exclude or not isinstance(cmd_data, dict):
+                continue
+            cand_map[sys.intern(cmd_name.lower())] = cmd_name
+            for alias in cmd_data.get('aliases', []):
+                cand_map[sys.intern(alias.lower())] = cmd_name
+
+        return tuple(cand_map.keys()), cand_map
+
+    def _scan_candidates(self, text: str, threshold: int = 80) -> Dict[str, str]:
+        """
+        Score text against every command candidate in one cdist call.
+
+        A single process.cdist call replaces the four separate fuzzy scans
+        the subparsers used to perform; candidate preprocessing happens once
+        inside rapidfuzz. Below-cutoff candidates come back as 0.
+
+        Args:
+            text: Normalized speech text
+            threshold: Match score threshold (0-100), default 80
+
+        Returns:
+            Mapping of section key to its best-scoring candidate at or above
+            the threshold (empty if nothing matches)
+        """
+        if not text or not self._all_candidates:
+            return {}
+
+        scores = process.cdist(
+            [text], self._all_candidates, scorer=fuzz.ratio, score_cutoff=threshold
+        )[0]
+
+        best_scores: Dict[str, float] = {}
+        matches: Dict[str, str] = {}
+        for candidate, owner, score in zip(
+            self._all_candidates, self._candidate_owners, scores
+        ):
+            if score >= threshold and score > best_scores.get(owner, 0.0):
+                best_scores[owner] = float(score)
+                matches[owner] = candidate
+
+        return matches
+
     def match_number_word(self, text: str, threshold: int = 75) -> Optional[int]:
         """
         Match a word to a number using fuzzy matching.
@@ -142,10 +252,10 @@ class CommandParser:
         
         if best_match:
             matched_number = self.word_to_number[best_match]
-            logger.debug(f"Matched '{text}' -> '{best_match}' ({matched_number}) with score {best_score:.1f}")
+            logger.debug("Matched '%s' -> '%s' (%s) with score %.1f", text, best_match, matched_number, best_score)
             return matched_number
         
-        logger.debug(f"No match found for '{text}' (best score: {best_score:.1f})")
+        logger.debug("No match found for '%s' (best score: %.1f)", text, best_score)
         return None
     
     def _phonetic_similarity(self, word1: str, word2: str) -> float:
@@ -225,45 +335,73 @@ class CommandParser:
             logger.warning("Empty text provided to parse")
             return None
         
-        logger.debug(f"Parsing text: '{text}'")
-        
+        logger.debug("Parsing text: '%s'", text)
+
+        # Score against every section's candidates in one cdist call; the
+        # subparsers below just consume their section's best match
+        matches = self._scan_candidates(text)
+
         # TRY NAVIGATION FIRST (before number sequences)
         # This prevents "skip 4" from being parsed as the number "4"
-        navigation = self._parse_navigation(text)
+        navigation = self._parse_navigation(text, matches.get('navigation'))
         if navigation:
-            logger.debug(f"Matched as navigation command: {navigation}")
+            logger.debug("Matched as navigation command: %s", navigation)
             return navigation
         
         # Try to parse as number sequence or single number
-        if self.is_number_sequence(text):
-            numbers = self.extract_numbers(text)
-            if numbers:
-                action_type = "number_sequence" if len(numbers) > 1 else "single_number"
-                cmd = Command(
-                    action=action_type,
-                    numbers=numbers
-                )
-                logger.info(f"Parsed as {action_type}: {numbers}")
-                return cmd
-        
-        # Try to parse as perio indicator
-        indicator = self._parse_indicator(text)
-        if indicator:
-            return indicator
-        
-        # Try to parse as action
-        action = self._parse_action(text)
-        if action:
-            return action
-        
-        # Try to parse as app control
-        app_control = self._parse_app_control(text)
-        if app_control:
-            return app_control
-        
-        logger.warning(f"Could not parse text: '{text}'")
+        numbers = self._parse_number_sequence(text)
+        if numbers:
+            action_type = "number_sequence" if len(numbers) > 1 else "single_number"
+            cmd = Command(action_type, {'numbers': numbers})
+            logger.info("Parsed as %s: %s", action_type, numbers)
+            return cmd
+        
+        # Try the remaining subparsers (indicator, action, app control) in
+        # priority order via the pre-bound dispatch list
+        for section, parser in self._parsers:
+            result = parser(text, matches.get(section))
+            if result is not None:
+                return result
+
+
+        logger.warning("Could not parse text: '%s'", text)
         return None
     
+    def _parse_number_sequence(self, text: str) -> Optional[List[int]]:
+        """
+        Tokenize text once and return its numbers, or None if not a sequence.
+
+        Fuses the is_number_sequence check and extract_numbers conversion
+        that parse() used to run back-to-back, so the success path splits
+        and matches each token exactly once instead of twice.
+
+        Args:
+            text: Normalized (stripped, lowercased) speech text
+
+        Returns:
+            List of 1-6 extracted integers, or None if any word is not a
+            number or the sequence length is out of range
+        """
+        if not text or not self.word_to_number:
+            return None
+
+        words = text.split()
+        if not 1 <= len(words) <= 6:
+            return None
+
+        get = self.word_to_number.get
+        numbers: List[int] = []
+        for word in words:
+            num = get(word)
+            if num is None:
+                # Fall back to fuzzy matching for misheard words
+                num = self.match_number_word(word, threshold=75)
+                if num is None:
+                    return None
+            numbers.append(num)
+
+        return numbers
+
     def is_number_sequence(self, text: str) -> bool:
         """
         Check if text is a sequence of numbers.
@@ -282,29 +420,37 @@ class CommandParser:
         Returns:
             True if text is primarily numbers with valid sequence length, False otherwise
         """
-        text = text.strip().lower()
-        
+        return self._is_number_sequence_norm(text.strip().lower())
+
+    def _is_number_sequence_norm(self, text: str) -> bool:
+        """is_number_sequence for already-normalized (stripped, lowercased) text.
+
+        parse() normalizes once up front; going through this variant skips
+        the two string re-allocations the public wrapper performs.
+        """
         if not text or not self.word_to_number:
             return False
-        
-        # Split text into tokens
+
+        # Split text into tokens; length check first so over-long sequences
+        # are rejected before any matching work
         words = text.split()
-        
-        # Try to match each word to a number (using fuzzy matching)
-        matched_numbers = []
+        if not 1 <= len(words) <= 6:
+            logger.debug("is_number_sequence('%s'): False (invalid length %d)", text, len(words))
+            return False
+
+        # Every word must be a number: frozenset membership is the exact
+        # fast path, with fuzzy matching for misheard words. Bail on the
+        # first word that matches neither.
+        number_words = self._number_words
         for w in words:
-            matched_num = self.match_number_word(w, threshold=75)
-            if matched_num is not None:
-                matched_numbers.append(matched_num)
-        
-        # Valid sequence if all words are numbers and count is 1-6
-        is_valid = (
-            len(matched_numbers) == len(words) and
-            1 <= len(matched_numbers) <= 6
-        )
-        
-        logger.debug(f"is_number_sequence('{text}'): {is_valid} (found {len(matched_numbers)} numbers)")
-        return is_valid
+            if w in number_words:
+                continue
+            if self.match_number_word(w, threshold=75) is None:
+                logger.debug("is_number_sequence('%s'): False ('%s' is not a number)", text, w)
+                return False
+
+        logger.debug("is_number_sequence('%s'): True", text)
+        return True
     
     def extract_numbers(self, text: str) -> List[int]:
         """
@@ -324,11 +470,14 @@ class CommandParser:
         Returns:
             List of extracted integers (e.g., [3, 2, 3]) or empty list if no numbers found
         """
-        text = text.strip().lower()
+        return self._extract_numbers_norm(text.strip().lower())
+
+    def _extract_numbers_norm(self, text: str) -> List[int]:
+        """extract_numbers for already-normalized (stripped, lowercased) text."""
         numbers: List[int] = []
-        
+
         if not text or not self.word_to_number:
-            logger.warning(f"Cannot extract numbers: text='{text}', mapping available={bool(self.word_to_number)}")
+            logger.warning("Cannot extract numbers: text='%s', mapping available=%s", text, bool(self.word_to_number))
             return numbers
         
         # Split text into words and convert to numbers using fuzzy matching
@@ -342,75 +491,126 @@ class CommandParser:
                 matched_num = self.match_number_word(word, threshold=75)
                 if matched_num is not None:
                     numbers.append(matched_num)
-                    logger.debug(f"Fuzzy matched '{word}' to {matched_num}")
+                    logger.debug("Fuzzy matched '%s' to %s", word, matched_num)
                 else:
                     logger.debug(f"Word '{word}' not recognized as number (no match above threshold)")
         
-        logger.debug(f"Extracted numbers from '{text}': {numbers}")
+        logger.debug("Extracted numbers from '%s': %s", text, numbers)
         return numbers
     
-    def _parse_indicator(self, text: str) -> Optional[Command]:
+    def _parse_section(self, section: str, text: str, match: Optional[str]) -> Optional[Command]:
+        """
+        Build a Command from one section's fuzzy-match result.
+
+        Generic matcher behind _parse_indicator/_parse_navigation/
+        _parse_action/_parse_app_control: resolves the matched candidate to
+        its canonical command and delegates parameter shaping to the
+        section's builder from _SECTION_SPEC.
+
+        Args:
+            section: Section key in commands_db (e.g., 'perio_indicators')
+            text: Recognized speech text
+            match: Best candidate for this section from _scan_candidates
+
+        Returns:
+            Command object or None if the section has no match
+        """
+        names, candidates = self._candidates.get(section, ((), {}))
+        if not names or not match:
+            return None
+
+        cmd_name = candidates[match]
+        cmd_data = self.commands_db[section][cmd_name]
+
+        command_action, build_params = self._SECTION_SPEC[section]
+        cmd_params = build_params(self, cmd_name, cmd_data, text)
+
+        logger.info("Parsed %s: %s", command_action, cmd_name)
+        return Command(command_action, cmd_params)
+
+    def _build_indicator_params(self, cmd_name: str, cmd_data: Dict[str, Any],
+                                text: str) -> Dict[str, Any]:
+        """Shape params for a perio indicator, including optional class."""
+        cmd_params: Dict[str, Any] = {
+            'indicator': cmd_name,
+            'indicator_action': cmd_data.get('action', 'keystroke'),
+            'key': cmd_data.get('key')
+        }
+
+        # Check for class-based indicators (furcation, mobility)
+        class_key = self._extract_class(text)
+        if class_key and 'classes' in cmd_data:
+            cmd_params['class'] = class_key
+
+        return cmd_params
+
+    def _build_navigation_params(self, cmd_name: str, cmd_data: Dict[str, Any],
+                                 text: str) -> Dict[str, Any]:
+        """Shape params for a navigation command."""
+        cmd_params: Dict[str, Any] = {
+            'command': cmd_name,
+            'nav_action': cmd_data.get('action', 'keystroke'),
+        }
+
+        # Add action-specific parameters
+        for key in ('key', 'quadrant', 'side'):
+            if key in cmd_data:
+                cmd_params[key] = cmd_data[key]
+
+        return cmd_params
+
+    def _build_action_params(self, cmd_name: str, cmd_data: Dict[str, Any],
+                             text: str) -> Dict[str, Any]:
+        """Shape params for an action command (enter, cancel, save, undo)."""
+        return {
+            'action_name': cmd_name,
+            'action_type': cmd_data.get('action', 'keystroke'),
+            'key': cmd_data.get('key')
+        }
+
+    def _build_app_control_params(self, cmd_name: str, cmd_data: Dict[str, Any],
+                                  text: str) -> Dict[str, Any]:
+        """Shape params for an app control command (wake, sleep, stop)."""
+        return {
+            'command': cmd_data.get('command', cmd_name)
+        }
+
+    # Section key -> (Command.action, parameter builder). Single place to
+    # hook new command categories into the generic matcher.
+    _SECTION_SPEC = {
+        'perio_indicators': ('indicator', _build_indicator_params),
+        'navigation': ('navigation', _build_navigation_params),
+        'actions': ('typed_action', _build_action_params),
+        'app_control': ('app_control', _build_app_control_params),
+    }
+
+    def _parse_indicator(self, text: str, match: Optional[str] = None) -> Optional[Command]:
         """
         Parse perio indicator command.
-        
-        Matches text against perio indicator commands (bleeding, suppuration, etc.)
-        using fuzzy matching to handle speech variations.
-        
+
         Args:
             text: Recognized speech text
-            
+            match: Best indicator candidate from _scan_candidates, if any
+
         Returns:
             Command object or None if not recognized as indicator
         """
-        if 'perio_indicators' not in self.commands_db:
-            return None
-        
-        indicators = self.commands_db['perio_indicators']
-        
-        # Build list of all indicator names and aliases
-        candidates: Dict[str, str] = {}  # Candidate text -> indicator name
-        for indicator_name, indicator_data in indicators.items():
-            candidates[indicator_name] = indicator_name
-            if 'aliases' in indicator_data:
-                for alias in indicator_data['aliases']:
-                    candidates[alias] = indicator_name
-        
-        # Try fuzzy match
-        match = self.fuzzy_match(text, list(candidates.keys()), threshold=80)
-        
-        if match:
-            indicator_name = candidates[match]
-            indicator_data = indicators[indicator_name]
-            
-            # Check for class-based indicators (furcation, mobility)
-            class_key = self._extract_class(text)
-            
-            cmd_params: Dict[str, Any] = {
-                'indicator': indicator_name,
-                'indicator_action': indicator_data.get('action', 'keystroke'),
-                'key': indicator_data.get('key')
-            }
-            
-            if class_key and 'classes' in indicator_data:
-                cmd_params['class'] = class_key
-            
-            logger.info(f"Parsed indicator: {indicator_name}")
-            return Command(action='indicator', **cmd_params)
-        
-        return None
-    
-    def _parse_navigation(self, text: str) -> Optional[Command]:
+        return self._parse_section('perio_indicators', text, match)
+
+
+    def _parse_navigation(self, text: str, match: Optional[str] = None) -> Optional[Command]:
         """
         Parse navigation command.
-        
+
         Matches text against navigation commands (next, previous, quadrant jumps, etc.)
         using fuzzy matching to handle speech variations.
-        
+
         Special handling for "skip N" format (e.g., "skip 5", "skip 2").
-        
+
         Args:
             text: Recognized speech text
-            
+            match: Best navigation candidate from _scan_candidates, if any
+
         Returns:
             Command object or None if not recognized as navigation
         """
@@ -428,155 +628,62 @@ class CommandParser:
             number_words = ' '.join(words[1:]).lower()
             if number_words in self.word_to_number:
                 skip_count = self.word_to_number[number_words]
-                logger.info(f"Parsed as skip_count: {skip_count} fields")
-                return Command(
-                    action='navigation',
-                    command='skip_count',
-                    nav_action='skip_fields',
-                    skip_count=skip_count
-                )
+                logger.info("Parsed as skip_count: %s fields", skip_count)
+                return Command('navigation', {
+                    'command': 'skip_count',
+                    'nav_action': 'skip_fields',
+                    'skip_count': skip_count,
+                })
         
         # Check for plain "skip" or its aliases (without number)
         if len(words) == 1:
             word_lower = words[0].lower()
             if word_lower in ['skip', 'skip\'s']:
                 logger.info("Parsed as skip (plain)")
-                return Command(
-                    action='navigation',
-                    command='skip',
-                    nav_action='skip_zeros'
-                )
+                return Command('navigation', {
+                    'command': 'skip',
+                    'nav_action': 'skip_zeros',
+                })
             # Check aliases for skip
             skip_data = navigation_cmds.get('skip', {})
             if 'aliases' in skip_data:
                 for alias in skip_data['aliases']:
                     if alias.lower() == word_lower:
-                        logger.info(f"Parsed as skip (alias: {alias})")
-                        return Command(
-                            action='navigation',
-                            command='skip',
-                            nav_action='skip_zeros'
-                        )
-        
-        # Build list of all navigation names and aliases (excluding 'skip' variations)
-        candidates: Dict[str, str] = {}  # Candidate text -> command name
-        for cmd_name, cmd_data in navigation_cmds.items():
-            # Skip 'skip' and 'skip_count' - they're handled above
-            if cmd_name in ['skip', 'skip_count']:
-                continue
-            candidates[cmd_name] = cmd_name
-            if 'aliases' in cmd_data:
-                for alias in cmd_data['aliases']:
-                    candidates[alias] = cmd_name
-        
-        # Try fuzzy match on remaining navigation commands
-        if candidates:
-            match = self.fuzzy_match(text, list(candidates.keys()), threshold=80)
-            
-            if match:
-                cmd_name = candidates[match]
-                cmd_data = navigation_cmds[cmd_name]
-                
-                cmd_params: Dict[str, Any] = {
-                    'command': cmd_name,
-                    'nav_action': cmd_data.get('action', 'keystroke'),
-                }
-                
-                # Add action-specific parameters
-                for key in ['key', 'quadrant', 'side']:
-                    if key in cmd_data:
-                        cmd_params[key] = cmd_data[key]
-                
-                logger.info(f"Parsed navigation: {cmd_name}")
-                return Command(action='navigation', **cmd_params)
-        
-        return None
-    
-    def _parse_action(self, text: str) -> Optional[Command]:
+                        logger.info("Parsed as skip (alias: %s)", alias)
+                        return Command('navigation', {
+                            'command': 'skip',
+                            'nav_action': 'skip_zeros',
+                        })
+        
+        # Generic matching for the remaining navigation commands
+        # ('skip'/'skip_count' are excluded from the candidate table)
+        return self._parse_section('navigation', text, match)
+
+    def _parse_action(self, text: str, match: Optional[str] = None) -> Optional[Command]:
         """
         Parse action command (enter, cancel, save, undo).
-        
-        Matches text against action commands using fuzzy matching to handle
-        speech variations.
-        
+
         Args:
             text: Recognized speech text
-            
+            match: Best action candidate from _scan_candidates, if any
+
         Returns:
             Command object or None if not recognized as action
         """
-        if 'actions' not in self.commands_db:
-            return None
-        
-        actions = self.commands_db['actions']
-        
-        # Build list of all action names and aliases
-        candidates: Dict[str, str] = {}  # Candidate text -> action name
-        for action_name, action_data in actions.items():
-            candidates[action_name] = action_name
-            if 'aliases' in action_data:
-                for alias in action_data['aliases']:
-                    candidates[alias] = action_name
-        
-        # Try fuzzy match
-        match = self.fuzzy_match(text, list(candidates.keys()), threshold=80)
-        
-        if match:
-            action_name = candidates[match]
-            action_data = actions[action_name]
-            
-            cmd_params: Dict[str, Any] = {
-                'action_name': action_name,
-                'action_type': action_data.get('action', 'keystroke'),
-                'key': action_data.get('key')
-            }
-            
-            logger.info(f"Parsed action: {action_name}")
-            return Command(action='typed_action', **cmd_params)
-        
-        return None
-    
-    def _parse_app_control(self, text: str) -> Optional[Command]:
+        return self._parse_section('actions', text, match)
+
+    def _parse_app_control(self, text: str, match: Optional[str] = None) -> Optional[Command]:
         """
         Parse app control command (wake, sleep, stop).
-        
-        Matches text against app control commands using fuzzy matching to handle
-        multi-word commands like "voice perio wake".
-        
+
         Args:
             text: Recognized speech text
-            
+            match: Best app control candidate from _scan_candidates, if any
+
         Returns:
             Command object or None if not recognized as app control
         """
-        if 'app_control' not in self.commands_db:
-            return None
-        
-        app_control_cmds = self.commands_db['app_control']
-        
-        # Build list of all app control names and aliases
-        candidates: Dict[str, str] = {}  # Candidate text -> command name
-        for cmd_name, cmd_data in app_control_cmds.items():
-            candidates[cmd_name] = cmd_name
-            if 'aliases' in cmd_data:
-                for alias in cmd_data['aliases']:
-                    candidates[alias] = cmd_name
-        
-        # Try fuzzy match
-        match = self.fuzzy_match(text, list(candidates.keys()), threshold=80)
-        
-        if match:
-            cmd_name = candidates[match]
-            cmd_data = app_control_cmds[cmd_name]
-            
-            cmd_params: Dict[str, Any] = {
-                'command': cmd_data.get('command', cmd_name)
-            }
-            
-            logger.info(f"Parsed app control: {cmd_name}")
-            return Command(action='app_control', **cmd_params)
-        
-        return None
+        return self._parse_section('app_control', text, match)
     
     def _extract_class(self, text: str) -> Optional[int]:
         """
@@ -602,34 +709,31 @@ class CommandParser:
         
         return None
     
-    def fuzzy_match(self, text: str, candidates: List[str], threshold: int = 80) -> Optional[str]:
+    def fuzzy_match(self, text: str, candidates: Sequence[str], threshold: int = 80) -> Optional[str]:
         """
         Find best matching candidate using fuzzy string matching.
         
-        Uses RapidFuzz library for efficient string similarity matching.
-        Handles speech variations and typos gracefully.
-        
+        Uses RapidFuzz's process.extractOne, which runs the whole candidate
+        scan inside the C++ extension with score_cutoff short-circuiting,
+        rather than paying a Python->C call per candidate.
+
         Args:
             text: Input text to match
             candidates: List of candidate strings to match against
             threshold: Match score threshold (0-100), default 80
-            
+
         Returns:
             Best matching candidate string or None if score below threshold
         """
         if not text or not candidates:
             return None
-        
-        best_match: Optional[str] = None
-        best_score = 0.0
-        
-        for candidate in candidates:
-            score = float(fuzz.ratio(text, candidate))
-            if score > best_score and score >= threshold:
-                best_match = candidate
-                best_score = score
-        
-        if best_match:
-            logger.debug(f"Fuzzy match '{text}' -> '{best_match}' (score={best_score})")
-        
-        return best_match
+
+        result = process.extractOne(
+            text, candidates, scorer=fuzz.ratio, score_cutoff=threshold
+        )
+
+        if result:
+            logger.debug("Fuzzy match '%s' -> '%s' (score=%.1f)", text, result[0], result[1])
+            return result[0]
+
+        return None
@@ -3,16 +3,72 @@ Configuration Manager - Application configuration handling
 Manages loading and saving configuration from/to JSON files
 """
 
+import atexit
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 import logging
-import copy
+
+try:
+    # Optional accelerator: orjson serializes in C even with indentation,
+    # while stdlib json.dump with indent falls off its C fast path
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "key absent" from "value is None" during merges
+_MISSING = object()
+
+
+def _flatten(nested: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a nested dict into a {dotted.key: leaf} mapping.
+
+    Non-empty dicts become prefixes; everything else (including empty
+    dicts) is a leaf. Iterative with an explicit stack - no Python call
+    overhead per nesting level, no recursion limit.
+    """
+    flat: Dict[str, Any] = {}
+    stack = [('', nested)]
+
+    while stack:
+        prefix, level = stack.pop()
+        for key, value in level.items():
+            dotted = prefix + key
+            if isinstance(value, dict) and value:
+                stack.append((dotted + '.', value))
+            else:
+                flat[dotted] = value
+
+    return flat
+
+
+def _unflatten(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a nested dict from a {dotted.key: leaf} mapping.
+
+    Later entries win on conflict, so a scalar override for a whole
+    section replaces the section dict built from earlier keys - the
+    usual override-wins merge rule.
+    """
+    nested: Dict[str, Any] = {}
+
+    for dotted, value in flat.items():
+        keys = dotted.split('.')
+        level = nested
+        for key in keys[:-1]:
+            child = level.get(key)
+            if not isinstance(child, dict):
+                child = {}
+                level[key] = child
+            level = child
+        level[keys[-1]] = value
+
+    return nested
+
 
 class ConfigManager:
     """
@@ -53,7 +109,19 @@ class ConfigManager:
             "toggle_listening": "ctrl+shift+v"
         }
     }
-    
+
+    # Frozen merge plan: DEFAULT_CONFIG is constant, so its flat
+    # {dotted.key: default} form is computed once at class definition.
+    # load() merges against this table with a plain dict union instead of
+    # re-discovering the default tree's shape with isinstance checks, and
+    # get() uses it as a one-hit fallback for keys missing from the live
+    # config.
+    _DEFAULT_FLAT = _flatten(DEFAULT_CONFIG)
+
+    # Seconds to wait after a set() before writing, so bursts (e.g. a GUI
+    # slider) coalesce into one disk write
+    SAVE_DEBOUNCE_SECONDS = 0.25
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize config manager.
@@ -62,16 +130,49 @@ class ConfigManager:
             config_path: Path to config file (default: %APPDATA%/VoicePerio/config.json)
         """
         if config_path:
-            self.config_path = Path(config_path)
+            path_str = os.fspath(config_path)
         else:
             # Use %APPDATA% if available, otherwise fall back to user home directory.
             # Never use a relative path — it may point to a read-only USB drive.
-            appdata = os.getenv('APPDATA') or os.path.expanduser('~')
-            self.config_path = Path(appdata) / 'VoicePerio' / 'config.json'
+            appdata = os.environ.get('APPDATA') or os.path.expanduser('~')
+            path_str = os.path.join(appdata, 'VoicePerio', 'config.json')
+
+        # Plain string for open() calls (skips Path.__fspath__ per I/O);
+        # the Path object stays for callers that want the richer API
+        self._config_path_str = path_str
+        self.config_path = Path(path_str)
         
-        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        # Canonical storage is the flat {dotted.key: value} mapping -
+        # get()/set() are single dict hits against it. The nested form
+        # only exists at the load/save boundaries (and through the
+        # .config property for callers that want the tree view).
+        # load() populates this.
+        self._flat: Dict[str, Any] = {}
+
+        # Debounced-save state: set() marks dirty and (re)arms the timer;
+        # _flush performs the actual write. atexit guarantees persistence
+        # even if the process exits inside the debounce window.
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        atexit.register(self.flush)
+
         self.load()
-    
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Nested view of the configuration, rebuilt from flat storage.
+
+        Kept for callers that work with the whole tree (tests, the
+        settings dialog's reset-to-defaults). Mutations to the returned
+        dict are not seen by get()/set(); assign back to persist them.
+        """
+        return _unflatten(self._flat)
+
+    @config.setter
+    def config(self, nested: Dict[str, Any]) -> None:
+        self._flat = _flatten(nested)
+
     def load(self) -> bool:
         """
         Load configuration from file.
@@ -79,22 +180,40 @@ class ConfigManager:
         Returns:
             True if loaded successfully
         """
-        if not self.config_path.exists():
-            logger.info(f"Config file not found: {self.config_path}")
-            self.save()  # Create default config
-            return True
-        
+        # Open directly instead of probing exists() first - the probe
+        # costs a second stat syscall per load and races with the file
+        # appearing/disappearing anyway
         try:
-            with open(self.config_path, 'r') as f:
-                user_config = json.load(f)
-            
-            # Merge with defaults
-            self.config = self._deep_merge(self.DEFAULT_CONFIG, user_config)
+            # Read bytes and let the parser handle UTF-8: both json.loads
+            # and orjson.loads detect the encoding in C, bypassing the
+            # text-mode incremental decoder
+            with open(self._config_path_str, 'rb') as f:
+                raw = f.read()
+            user_config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+            # Merge with defaults: flatten the user config and union it
+            # over the precomputed flat default table (override wins).
+            # The result IS the working representation - no nested
+            # rebuild until the next save
+            self._flat = {**self._DEFAULT_FLAT, **_flatten(user_config)}
             logger.info(f"Loaded config from {self.config_path}")
             return True
-        
+
+        except FileNotFoundError:
+            logger.info(f"Config file not found: {self.config_path}")
+            self._flat = dict(self._DEFAULT_FLAT)
+            # Don't write the default file synchronously during startup:
+            # mark dirty and let the first real change or the atexit
+            # flush create it
+            with self._save_lock:
+                self._dirty = True
+            return True
+
         except Exception as e:
             logger.error(f"Error loading config: {e}")
+            if not self._flat:
+                # Keep a usable config even when the file is unreadable
+                self._flat = dict(self._DEFAULT_FLAT)
             return False
     
     def save(self) -> bool:
@@ -107,10 +226,28 @@ class ConfigManager:
         try:
             # Create directory if needed
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            
+
+            # Nested form is rebuilt only here, at the persistence boundary
+            nested = _unflatten(self._flat)
+
+            if orjson is not None:
+                data = orjson.dumps(
+                    nested,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+                )
+            else:
+                data = json.dumps(nested, indent=2).encode('utf-8')
+
+            # Write-then-rename so readers never see a partial file: the
+            # rename is atomic on the same filesystem, and an interrupted
+            # write leaves at worst a stale .tmp next to an intact config.
+            # No fsync - losing the very last change on power cut beats
+            # stalling the writer on every debounced save.
+            tmp_path = self._config_path_str + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._config_path_str)
+
             logger.info(f"Saved config to {self.config_path}")
             return True
         
@@ -129,16 +266,16 @@ class ConfigManager:
         Returns:
             Config value or default
         """
-        keys = key_path.split('.')
-        value = self.config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        # Flat storage: the dotted path is the key, so a lookup is one
+        # dict hit - no split, no per-level isinstance walk
+        value = self._flat.get(key_path, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Absent from the live config (e.g. after a partial direct
+        # .config assignment): fall back to the flat default table
+        value = self._DEFAULT_FLAT.get(key_path, _MISSING)
+        return default if value is _MISSING else value
     
     def set(self, key_path: str, value: Any) -> bool:
         """
@@ -151,35 +288,33 @@ class ConfigManager:
         Returns:
             True if set successfully
         """
-        keys = key_path.split('.')
-        config = self.config
-        
-        for key in keys[:-1]:
-            if key not in config:
-                config[key] = {}
-            config = config[key]
-        
-        config[keys[-1]] = value
-        return self.save()
-    
-    @staticmethod
-    def _deep_merge(base: Dict, override: Dict) -> Dict:
+        self._flat[key_path] = value
+        self._schedule_save()
+        return True
+
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and (re)arm the debounce timer."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> bool:
         """
-        Deep merge override dict into base dict.
-        
-        Args:
-            base: Base configuration
-            override: Configuration to merge
-            
+        Write any pending debounced changes to disk immediately.
+
         Returns:
-            Merged configuration
+            True if nothing was pending or the write succeeded
         """
-        result = copy.deepcopy(base)
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = ConfigManager._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        
-        return result
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
+
+        return self.save()
@@ -6,14 +6,138 @@ and the last recognized command. Updates in real-time as status changes.
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QColor, QPalette, QIcon
+from PyQt6.QtCore import Qt, QPoint, QRect, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont, QColor, QGuiApplication, QPalette, QIcon
+from functools import lru_cache
 from pathlib import Path
 import logging
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# QSS parsed once per setStyleSheet call, so build the sheet a single time
+# at import. Label text colors are deliberately not in the sheet - they are
+# driven through palette swaps below, which skip QSS re-parsing entirely.
+_INDICATOR_STYLE = """
+    QWidget {
+        background-color: #1a1a1a;
+        border: 2px solid #2196F3;
+        border-radius: 8px;
+    }
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        font-weight: bold;
+        padding: 2px;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton:pressed {
+        background-color: #0d47a1;
+    }
+"""
+
+# Status label colors, keyed by status text ("Ready" falls through to white)
+_STATUS_COLORS = {
+    "Listening": QColor("#4CAF50"),
+    "Paused": QColor("#FF9800"),
+    "Sleeping": QColor("#9E9E9E"),
+}
+_DEFAULT_TEXT_COLOR = QColor("#ffffff")
+_COMMAND_COLOR = QColor("#4CAF50")
+
+# Pre-formatted status label text for the known (status, listening) pairs,
+# so steady-state updates don't rebuild the same f-string
+_STATUS_DISPLAY = {
+    ("Listening", True): "🎤 Listening",
+    ("Listening", False): "Listening",
+    ("Paused", False): "Paused",
+    ("Sleeping", False): "Sleeping",
+    ("Ready", False): "Ready",
+}
+
+
+@lru_cache(maxsize=None)
+def _status_font() -> QFont:
+    """Shared bold 10pt status font (QFont is copy-on-write, sharing is safe).
+
+    Built lazily on first use rather than at import so QGuiApplication
+    exists before any font machinery is touched.
+    """
+    font = QFont()
+    font.setPointSize(10)
+    font.setBold(True)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _command_font() -> QFont:
+    """Shared 8pt command font."""
+    font = QFont()
+    font.setPointSize(8)
+    return font
+
+
+# Available screen geometry, cached per QScreen after the first query:
+# asking the window system is a platform round-trip, and the answer only
+# changes when the monitor layout or a screen's work area does - which is
+# what the hooks below watch for (screenAdded/screenRemoved plus each
+# screen's availableGeometryChanged for resolution/taskbar changes).
+_geometry_cache: dict = {}
+_geometry_hooks_connected = False
+
+
+def _invalidate_geometry_cache(*_args) -> None:
+    """Drop all cached geometry when screens change in any way."""
+    _geometry_cache.clear()
+
+
+def _hook_screen(screen) -> None:
+    """Watch one screen's work area; a taskbar move or resolution change
+    must drop the cache or every later positioning uses stale bounds."""
+    screen.availableGeometryChanged.connect(_invalidate_geometry_cache)
+
+
+def _on_screen_added(screen) -> None:
+    _invalidate_geometry_cache()
+    _hook_screen(screen)
+
+
+def _available_geometry(widget: QWidget) -> Optional[QRect]:
+    """Cached screen().availableGeometry() for the widget's screen."""
+    global _geometry_hooks_connected
+
+    screen = widget.screen()
+    if screen is None:
+        return None
+
+    geometry = _geometry_cache.get(screen)
+    if geometry is not None:
+        return geometry
+
+    if not _geometry_hooks_connected:
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(_on_screen_added)
+            app.screenRemoved.connect(_invalidate_geometry_cache)
+            for existing in app.screens():
+                _hook_screen(existing)
+            _geometry_hooks_connected = True
+
+    geometry = screen.availableGeometry()
+    _geometry_cache[screen] = geometry
+    return geometry
+
+
+def _set_label_color(label: QLabel, color: QColor) -> None:
+    """Recolor a label via its palette - no stylesheet re-parse/repolish."""
+    palette = label.palette()
+    palette.setColor(QPalette.ColorRole.WindowText, color)
+    label.setPalette(palette)
+
 
 class FloatingIndicator(QWidget):
     """
@@ -49,10 +173,16 @@ class FloatingIndicator(QWidget):
         self.status_text = "Ready"
         self.last_command = ""
         self.is_listening = False
-        
-        # Setup UI
-        self.init_ui()
-        
+
+        # Generation counter for the command auto-clear: each update bumps
+        # it, and only the newest pending single-shot is allowed to clear
+        self._feedback_epoch = 0
+
+        # Widgets, layout, stylesheet and screen-geometry query are
+        # deferred to the first show() - with show_floating_indicator off
+        # the indicator never pays for a UI it doesn't display
+        self._ui_ready = False
+
         # Set window properties
         self.setWindowTitle("VoicePerio Status")
         # WA_StaysOnTop doesn't exist in PyQt6 - use WindowStaysOnTopHint flag instead
@@ -61,17 +191,29 @@ class FloatingIndicator(QWidget):
             Qt.WindowType.WindowStaysOnTopHint |
             Qt.WindowType.Tool
         )
-        
+
+        logger.debug("FloatingIndicator initialized")
+
+    def _ensure_ui(self) -> None:
+        """Build the UI on first need and replay the current status onto it."""
+        if self._ui_ready:
+            return
+        self._ui_ready = True
+
+        self.init_ui()
+
         # Default position (bottom-right)
         self._set_default_position()
-        
-        # Auto-hide timer for command feedback
-        self.feedback_timer = QTimer()
-        self.feedback_timer.setSingleShot(True)
-        self.feedback_timer.timeout.connect(self._clear_command_feedback)
-        
-        logger.debug("FloatingIndicator initialized")
-    
+
+        # Labels start at "Ready"/empty; bring them up to date with any
+        # status set before the first show
+        self._update_status_display()
+
+    def showEvent(self, event) -> None:
+        """Construct the deferred UI before the window first appears."""
+        self._ensure_ui()
+        super().showEvent(event)
+
     def init_ui(self) -> None:
         """
         Initialize the UI components.
@@ -87,19 +229,16 @@ class FloatingIndicator(QWidget):
         
         # Status label
         self.status_label = QLabel("Ready")
-        status_font = QFont()
-        status_font.setPointSize(10)
-        status_font.setBold(True)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(_status_font())
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        _set_label_color(self.status_label, _DEFAULT_TEXT_COLOR)
         layout.addWidget(self.status_label)
         
         # Command label
         self.command_label = QLabel("")
-        command_font = QFont()
-        command_font.setPointSize(8)
-        self.command_label.setFont(command_font)
+        self.command_label.setFont(_command_font())
         self.command_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        _set_label_color(self.command_label, _COMMAND_COLOR)
         self.command_label.setMaximumWidth(200)
         self.command_label.setWordWrap(True)
         layout.addWidget(self.command_label)
@@ -124,31 +263,7 @@ class FloatingIndicator(QWidget):
     
     def _apply_stylesheet(self) -> None:
         """Apply stylesheet for professional appearance"""
-        style = """
-            QWidget {
-                background-color: #1a1a1a;
-                border: 2px solid #2196F3;
-                border-radius: 8px;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-weight: bold;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0d47a1;
-            }
-        """
-        self.setStyleSheet(style)
+        self.setStyleSheet(_INDICATOR_STYLE)
     
     def set_listening(self) -> None:
         """
@@ -157,6 +272,8 @@ class FloatingIndicator(QWidget):
         Example:
             >>> indicator.set_listening()
         """
+        if self.status_text == "Listening" and self.is_listening:
+            return
         self.status_text = "Listening"
         self.is_listening = True
         self._update_status_display()
@@ -169,6 +286,8 @@ class FloatingIndicator(QWidget):
         Example:
             >>> indicator.set_paused()
         """
+        if self.status_text == "Paused" and not self.is_listening:
+            return
         self.status_text = "Paused"
         self.is_listening = False
         self._update_status_display()
@@ -181,6 +300,8 @@ class FloatingIndicator(QWidget):
         Example:
             >>> indicator.set_sleeping()
         """
+        if self.status_text == "Sleeping" and not self.is_listening:
+            return
         self.status_text = "Sleeping"
         self.is_listening = False
         self._update_status_display()
@@ -193,6 +314,8 @@ class FloatingIndicator(QWidget):
         Example:
             >>> indicator.set_ready()
         """
+        if self.status_text == "Ready" and not self.is_listening:
+            return
         self.status_text = "Ready"
         self.is_listening = False
         self._update_status_display()
@@ -200,17 +323,32 @@ class FloatingIndicator(QWidget):
     
     def _update_status_display(self) -> None:
         """Update status label with current status"""
-        self.status_label.setText(f"🎤 {self.status_text}" if self.is_listening else self.status_text)
-        
-        # Update color based on status
-        if self.status_text == "Listening":
-            self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-        elif self.status_text == "Paused":
-            self.status_label.setStyleSheet("color: #FF9800; font-weight: bold;")
-        elif self.status_text == "Sleeping":
-            self.status_label.setStyleSheet("color: #9E9E9E; font-weight: bold;")
-        else:
-            self.status_label.setStyleSheet("color: #ffffff; font-weight: bold;")
+        if not self._ui_ready:
+            # State is tracked; _ensure_ui replays it when the UI is built
+            return
+
+        new_text = _STATUS_DISPLAY.get(
+            (self.status_text, self.is_listening),
+            f"🎤 {self.status_text}" if self.is_listening else self.status_text,
+        )
+
+        # Text and color are both functions of the status, so an unchanged
+        # label means nothing to do - skip the setText/repaint entirely
+        if new_text == self.status_label.text():
+            return
+
+        # setText and setPalette each schedule a repaint; suspending
+        # updates around the pair collapses them into a single paint event
+        self.status_label.setUpdatesEnabled(False)
+        try:
+            self.status_label.setText(new_text)
+
+            # Update color based on status via palette - unlike per-update
+            # setStyleSheet this doesn't re-parse CSS or repolish the widget
+            color = _STATUS_COLORS.get(self.status_text, _DEFAULT_TEXT_COLOR)
+            _set_label_color(self.status_label, color)
+        finally:
+            self.status_label.setUpdatesEnabled(True)
     
     def update_command(self, command: str) -> None:
         """
@@ -222,15 +360,41 @@ class FloatingIndicator(QWidget):
         Example:
             >>> indicator.update_command("three two three")
         """
+        if not self._ui_ready:
+            # Not shown yet: record the command, skip the label work
+            self.last_command = command
+            return
+
+        # Same command still on screen: just re-arm the auto-clear,
+        # skipping the redundant setText/repaint. (An empty label means the
+        # feedback was already cleared, so the text must be set again.)
+        if command == self.last_command and self.command_label.text():
+            self._arm_feedback_clear()
+            return
+
         self.last_command = command
         self.command_label.setText(f"Command: {command}")
-        self.command_label.setStyleSheet("color: #4CAF50;")
-        
+
         # Auto-clear after 3 seconds
-        self.feedback_timer.stop()
-        self.feedback_timer.start(3000)
-        
+        self._arm_feedback_clear()
+
         logger.debug(f"Command displayed: {command}")
+
+    def _arm_feedback_clear(self) -> None:
+        """(Re)arm the 3s command auto-clear without a persistent QTimer.
+
+        QTimer.singleShot avoids owning a QTimer + signal connection for
+        the indicator's lifetime; the epoch check makes stale shots from
+        earlier updates no-ops, which is how "re-arming" works here.
+        """
+        self._feedback_epoch += 1
+        epoch = self._feedback_epoch
+        QTimer.singleShot(
+            3000,
+            lambda: self._clear_command_feedback()
+            if epoch == self._feedback_epoch
+            else None,
+        )
     
     def _clear_command_feedback(self) -> None:
         """Clear command feedback after timeout"""
@@ -265,9 +429,8 @@ class FloatingIndicator(QWidget):
     
     def _set_default_position(self) -> None:
         """Set default position to bottom-right corner"""
-        screen = self.screen()
-        if screen:
-            geometry = screen.availableGeometry()
+        geometry = _available_geometry(self)
+        if geometry:
             x = geometry.right() - self.width() - 20
             y = geometry.bottom() - self.height() - 20
             self.move(int(x), int(y))
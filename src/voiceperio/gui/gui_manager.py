@@ -7,10 +7,10 @@ Thread-safe GUI updates using Qt signals/slots.
 """
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QThread
+from PyQt6.QtCore import Qt, QObject, QEvent, pyqtSignal, QTimer, QThread
 import logging
+import time
 from typing import Optional, Dict, Any, Callable
-from pathlib import Path
 
 from .system_tray import SystemTray
 from .floating_indicator import FloatingIndicator
@@ -19,15 +19,103 @@ from .modern_medical_ui import ModernMedicalUI
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for "key not seen before" in the settings diff
+_UNSET = object()
 
-class GUIManagerSignals(QObject):
-    """Signals emitted by GUIManager"""
-    
-    status_changed = pyqtSignal(str)  # Status text
-    command_feedback = pyqtSignal(str)  # Command text
-    listening_toggled = pyqtSignal(bool)  # True=listening, False=paused
-    settings_changed = pyqtSignal(dict)  # Settings dict
-    exit_requested = pyqtSignal()
+# Display status names, shared by the state table, comparisons and state
+# assignments. One module-level object per status means the equality
+# check in _set_state is satisfied by the identity fast path whenever
+# callers use these constants.
+STATUS_LISTENING = "Listening"
+STATUS_PAUSED = "Paused"
+STATUS_SLEEPING = "Sleeping"
+STATUS_READY = "Ready"
+
+
+class _NullUI:
+    """Inert stand-in for the active UI before setup() builds one.
+
+    Lets every call site invoke self._ui unconditionally instead of
+    None-checking first.
+    """
+
+    def set_status(self, status: str) -> None:
+        pass
+
+    def update_feedback(self, command: str) -> None:
+        pass
+
+    def show(self) -> None:
+        pass
+
+    def hide(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def set_opacity(self, opacity: float) -> None:
+        pass
+
+    def isVisible(self) -> bool:
+        return False
+
+    def windowOpacity(self) -> float:
+        return 1.0
+
+
+class _UIAdapter:
+    """Uniform facade over ModernMedicalUI / FloatingIndicator.
+
+    Built once in setup(), so per-event call sites become a single
+    unconditional method call instead of a use_modern_ui branch plus a
+    None check on every status update and command recognition.
+    """
+
+    __slots__ = ('widget', '_set_status', '_update_feedback')
+
+    def __init__(self, widget, modern: bool):
+        self.widget = widget
+        if modern:
+            self._set_status = widget.set_status
+            self._update_feedback = (
+                lambda command: widget.update_feedback(command, "success", "Recognized")
+            )
+        else:
+            # Map the adapter's lowercase status names onto the legacy
+            # indicator's one-method-per-status API
+            status_methods = {
+                "listening": widget.set_listening,
+                "paused": widget.set_paused,
+                "sleeping": widget.set_sleeping,
+                "ready": widget.set_ready,
+            }
+            self._set_status = lambda status: status_methods[status]()
+            self._update_feedback = widget.update_command
+
+    def set_status(self, status: str) -> None:
+        self._set_status(status)
+
+    def update_feedback(self, command: str) -> None:
+        self._update_feedback(command)
+
+    def show(self) -> None:
+        self.widget.show()
+
+    def hide(self) -> None:
+        self.widget.hide()
+
+    def close(self) -> None:
+        self.widget.close()
+
+    def set_opacity(self, opacity: float) -> None:
+        self.widget.set_opacity(opacity)
+
+    def isVisible(self) -> bool:
+        return self.widget.isVisible()
+
+    def windowOpacity(self) -> float:
+        return self.widget.windowOpacity()
 
 
 class GUIManager(QObject):
@@ -55,7 +143,28 @@ class GUIManager(QObject):
         >>> gui_manager.set_listening()
         >>> gui_manager.show_command_feedback("three two three")
     """
-    
+
+    # Signals live on the manager itself - it's already a QObject, so a
+    # separate holder object only added an attribute hop to every emit.
+    # The signals property below keeps the old access path working.
+    status_changed = pyqtSignal(str)  # Status text
+    command_feedback = pyqtSignal(str)  # Command text
+    listening_toggled = pyqtSignal(bool)  # True=listening, False=paused
+    settings_changed = pyqtSignal(dict)  # Settings dict
+    exit_requested = pyqtSignal()
+    notification_requested = pyqtSignal(str, str)  # Title, message
+
+    @property
+    def signals(self) -> 'GUIManager':
+        """Back-compat alias: external code connects via
+        gui_manager.signals.<name>; the signals are declared on this
+        class now. A property rather than ``self.signals = self`` - the
+        instance-attribute form creates a reference cycle, deferring the
+        QObject to the cyclic GC, which clears the Python state while
+        the C++ object (and its installed event filter) is still live.
+        """
+        return self
+
     def __init__(self, config_manager=None, app: Optional[QApplication] = None, use_modern_ui: bool = True):
         """
         Initialize GUI Manager.
@@ -75,26 +184,74 @@ class GUIManager(QObject):
         self.indicator: Optional[FloatingIndicator] = None
         self.modern_ui: Optional[ModernMedicalUI] = None
         self.settings_dialog: Optional[SettingsDialog] = None
+
+        # Active UI behind a uniform facade; replaced with the real
+        # adapter in setup(). Hot paths call self._ui directly.
+        self._ui = _NullUI()
         
         # State tracking
         self.is_listening = False
         self.is_visible = True
-        self.current_status = "Ready"
+        self.current_status = STATUS_READY
         self.session_time_seconds = 0
+
+        # Session time is wall-clock (monotonic start timestamp), not a
+        # tick counter - the display timer below only needs to run while
+        # the UI is actually visible
+        self._session_start: Optional[float] = None
+
+        # Cached GUI settings, refreshed by _refresh_settings_cache():
+        # show()/hide()/_apply_settings() run on every state transition,
+        # so they read these attributes instead of going through the
+        # config backend each time
+        self._cached_show_indicator = True
+        self._cached_opacity = 0.9
+
+        # Last settings payload seen from the dialog, used to forward
+        # only the keys that actually changed
+        self._settings_snapshot: Dict[str, Any] = {}
         
-        # Signals
-        self.signals = GUIManagerSignals()
+        self._signals_connected = False
+        self._cleaned_up = False
         
-        # Timer for periodic updates
+        # One shared periodic timer drives both the session clock and
+        # generic updates - two independent QTimers would double the
+        # event-loop wakeups for work that happily shares a tick
         self.update_timer = QTimer()
         self.update_timer.setSingleShot(False)
-        self.update_timer.timeout.connect(self._on_update_timer)
-        
-        # Session timer (for elapsed time tracking)
-        self.session_timer = QTimer()
-        self.session_timer.setSingleShot(False)
-        self.session_timer.timeout.connect(self._on_session_timer)
-        
+        self.update_timer.setInterval(1000)
+        self.update_timer.timeout.connect(self._tick)
+        self._session_ticking = False
+        self._update_ticking = False
+
+        # Subscribers for periodic updates; the shared timer never ticks
+        # for updates while this is empty
+        self._update_callbacks: list = []
+
+        # Command-feedback coalescer: fast dictation can emit feedback
+        # faster than repaints are worth doing, so renders are capped at
+        # one per 50ms window showing only the newest command. One
+        # single-shot timer is reused (isActive-guarded start) rather
+        # than allocating a QTimer.singleShot connection per flush -
+        # this fires on every recognized command, so the churn adds up.
+        self._pending_feedback: Optional[str] = None
+        self._feedback_timer = QTimer()
+        self._feedback_timer.setSingleShot(True)
+        self._feedback_timer.setInterval(50)
+        self._feedback_timer.timeout.connect(self._flush_feedback)
+
+        # Pre-bound slot references: accessing a method creates a fresh
+        # bound-method object each time, so bind the ones used across
+        # connect/disconnect once - connections and their teardown then
+        # share the exact same callables
+        self._toggle_visibility = self.toggle_visibility
+        self._show_settings = self.show_settings
+        self._toggle_listening = self.toggle_listening
+        self._hide_indicator = self.hide_indicator
+        self._on_status_changed_slot = self._on_status_changed
+        self._on_command_feedback_slot = self._on_command_feedback
+        self._on_notification_requested_slot = self._on_notification_requested
+
         logger.debug("GUIManager initialized")
     
     def setup(self) -> bool:
@@ -119,18 +276,24 @@ class GUIManager(QObject):
             # Create appropriate UI based on setting
             if self.use_modern_ui:
                 self.modern_ui = ModernMedicalUI()
+                self._ui = _UIAdapter(self.modern_ui, modern=True)
+                # Watch show/hide so the session display timer only runs
+                # while the widget can actually be seen
+                self.modern_ui.installEventFilter(self)
                 logger.debug("ModernMedicalUI created")
             else:
                 self.indicator = FloatingIndicator()
+                self._ui = _UIAdapter(self.indicator, modern=False)
                 logger.debug("FloatingIndicator created")
             
-            # Create settings dialog
-            self.settings_dialog = SettingsDialog(self.config)
-            
+            # Settings dialog is built lazily in show_settings() - most
+            # sessions never open it
+
             # Connect signals
             self._connect_signals()
-            
+
             # Load settings
+            self._refresh_settings_cache()
             self._apply_settings()
             
             logger.info("GUIManager setup completed successfully")
@@ -142,32 +305,66 @@ class GUIManager(QObject):
     
     def _connect_signals(self) -> None:
         """Connect signals between components"""
+        # Idempotence guard: a second setup() pass must not double-wire
+        # slots, or every emit would invoke them twice
+        if self._signals_connected:
+            return
+        self._signals_connected = True
+
         # System tray signals
         if self.tray:
-            self.tray.signals.show_hide_requested.connect(self.toggle_visibility)
-            self.tray.signals.settings_requested.connect(self.show_settings)
-            self.tray.signals.toggle_listening_requested.connect(self.toggle_listening)
-            self.tray.signals.exit_requested.connect(self.signals.exit_requested.emit)
-        
+            self.tray.signals.show_hide_requested.connect(self._toggle_visibility)
+            self.tray.signals.settings_requested.connect(self._show_settings)
+            self.tray.signals.toggle_listening_requested.connect(self._toggle_listening)
+            self.tray.signals.exit_requested.connect(self.exit_requested.emit)
+
         # Floating indicator signals (old UI)
         if self.indicator:
-            self.indicator.close_requested.connect(self.hide_indicator)
-        
+            self.indicator.close_requested.connect(self._hide_indicator)
+
         # Modern medical UI signals
         if self.modern_ui:
-            self.modern_ui.pause_requested.connect(self.toggle_listening)
-            self.modern_ui.settings_requested.connect(self.show_settings)
-            self.modern_ui.exit_requested.connect(self.signals.exit_requested.emit)
-        
-        # Settings dialog signals
-        if self.settings_dialog:
-            self.settings_dialog.settings_changed.connect(self._on_settings_changed)
-        
-        # Internal signals
-        self.signals.status_changed.connect(self._on_status_changed)
-        self.signals.command_feedback.connect(self._on_command_feedback)
+            self.modern_ui.pause_requested.connect(self._toggle_listening)
+            self.modern_ui.settings_requested.connect(self._show_settings)
+            self.modern_ui.exit_requested.connect(self.exit_requested.emit)
         
+        # Settings dialog signals are wired when the dialog is first
+        # built (see _ensure_settings_dialog)
+
+        # Internal signals: emitter and receiver live on the GUI thread,
+        # so connect directly - Qt then skips the auto-connection
+        # thread-affinity check on every emit
+        self.status_changed.connect(
+            self._on_status_changed_slot, type=Qt.ConnectionType.DirectConnection
+        )
+        self.command_feedback.connect(
+            self._on_command_feedback_slot, type=Qt.ConnectionType.DirectConnection
+        )
+        # Queued on purpose: show_notification may be called from the
+        # recognition thread, and tray balloons can take tens of ms -
+        # the event loop runs the actual tray call on the GUI thread
+        self.notification_requested.connect(
+            self._on_notification_requested_slot,
+            type=Qt.ConnectionType.QueuedConnection,
+        )
+
         logger.debug("Signals connected")
+
+    def _disconnect_signals(self) -> None:
+        """Undo _connect_signals so a later re-setup can rewire cleanly."""
+        if not self._signals_connected:
+            return
+        self._signals_connected = False
+
+        try:
+            self.status_changed.disconnect(self._on_status_changed_slot)
+            self.command_feedback.disconnect(self._on_command_feedback_slot)
+            self.notification_requested.disconnect(
+                self._on_notification_requested_slot
+            )
+        except TypeError:
+            # Already disconnected (e.g. Qt tore the objects down first)
+            pass
     
     def show(self) -> None:
         """
@@ -179,13 +376,9 @@ class GUIManager(QObject):
         if self.tray:
             self.tray.show()
         
-        # Show appropriate UI
-        if self.use_modern_ui:
-            if self.modern_ui and self.config and self.config.get("gui.show_floating_indicator", True):
-                self.modern_ui.show()
-        else:
-            if self.indicator and self.config and self.config.get("gui.show_floating_indicator", True):
-                self.indicator.show()
+        # Show the active UI
+        if self._cached_show_indicator:
+            self._ui.show()
         
         self.is_visible = True
         logger.debug("GUIManager components shown")
@@ -199,14 +392,9 @@ class GUIManager(QObject):
         """
         if self.tray:
             self.tray.hide()
-        
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.hide()
-        else:
-            if self.indicator:
-                self.indicator.hide()
-        
+
+        self._ui.hide()
+
         self.is_visible = False
         logger.debug("GUIManager components hidden")
     
@@ -217,14 +405,8 @@ class GUIManager(QObject):
         Example:
             >>> manager.show_indicator()
         """
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.show()
-                logger.debug("Modern medical UI shown")
-        else:
-            if self.indicator:
-                self.indicator.show()
-                logger.debug("Floating indicator shown")
+        self._ui.show()
+        logger.debug("Indicator UI shown")
     
     def hide_indicator(self) -> None:
         """
@@ -233,14 +415,8 @@ class GUIManager(QObject):
         Example:
             >>> manager.hide_indicator()
         """
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.hide()
-                logger.debug("Modern medical UI hidden")
-        else:
-            if self.indicator:
-                self.indicator.hide()
-                logger.debug("Floating indicator hidden")
+        self._ui.hide()
+        logger.debug("Indicator UI hidden")
     
     def toggle_visibility(self) -> None:
         """
@@ -253,89 +429,72 @@ class GUIManager(QObject):
             self.hide()
         else:
             self.show()
-        logger.debug(f"Visibility toggled: {self.is_visible}")
-    
+        logger.debug("Visibility toggled: %s", self.is_visible)
+    
+    # Status table driving _set_state: display name -> (tray method name
+    # or None, adapter status argument, is_listening value). One data
+    # row per state replaces four near-identical setter bodies.
+    _STATES = {
+        STATUS_LISTENING: ("set_listening", "listening", True),
+        STATUS_PAUSED: ("set_paused", "paused", False),
+        STATUS_SLEEPING: ("set_sleeping", "sleeping", False),
+        STATUS_READY: (None, "ready", False),  # tray has no ready state
+    }
+
+    def _set_state(self, status: str) -> None:
+        """Apply a status transition from the _STATES table."""
+        tray_method, ui_status, is_listening = self._STATES[status]
+
+        # Steady-state listening re-sets the same status constantly;
+        # skip the tray/UI round-trip when nothing changes
+        if self.current_status == status and self.is_listening == is_listening:
+            return
+
+        self.is_listening = is_listening
+        self.current_status = status
+
+        if tray_method is not None and self.tray:
+            getattr(self.tray, tray_method)()
+
+        self._ui.set_status(ui_status)
+
+        logger.debug("Status set to: %s", status)
+
     def set_listening(self) -> None:
         """
         Set status to listening.
-        
+
         Example:
             >>> manager.set_listening()
         """
-        self.is_listening = True
-        self.current_status = "Listening"
-        if self.tray:
-            self.tray.set_listening()
-        
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.set_status("listening")
-        else:
-            if self.indicator:
-                self.indicator.set_listening()
-        
-        logger.debug("Status set to: Listening")
-    
+        self._set_state(STATUS_LISTENING)
+
     def set_paused(self) -> None:
         """
         Set status to paused.
-        
+
         Example:
             >>> manager.set_paused()
         """
-        self.is_listening = False
-        self.current_status = "Paused"
-        if self.tray:
-            self.tray.set_paused()
-        
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.set_status("paused")
-        else:
-            if self.indicator:
-                self.indicator.set_paused()
-        
-        logger.debug("Status set to: Paused")
-    
+        self._set_state(STATUS_PAUSED)
+
     def set_sleeping(self) -> None:
         """
         Set status to sleeping.
-        
+
         Example:
             >>> manager.set_sleeping()
         """
-        self.is_listening = False
-        self.current_status = "Sleeping"
-        if self.tray:
-            self.tray.set_sleeping()
-        
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.set_status("sleeping")
-        else:
-            if self.indicator:
-                self.indicator.set_sleeping()
-        
-        logger.debug("Status set to: Sleeping")
-    
+        self._set_state(STATUS_SLEEPING)
+
     def set_ready(self) -> None:
         """
         Set status to ready.
-        
+
         Example:
             >>> manager.set_ready()
         """
-        self.is_listening = False
-        self.current_status = "Ready"
-        
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.set_status("ready")
-        else:
-            if self.indicator:
-                self.indicator.set_ready()
-        
-        logger.debug("Status set to: Ready")
+        self._set_state(STATUS_READY)
     
     def update_status(self, text: str) -> None:
         """
@@ -349,7 +508,7 @@ class GUIManager(QObject):
         Example:
             >>> manager.update_status("Listening for commands...")
         """
-        self.signals.status_changed.emit(text)
+        self._emit_or_call(self.status_changed, self._on_status_changed, text)
     
     def show_command_feedback(self, command: str) -> None:
         """
@@ -363,7 +522,19 @@ class GUIManager(QObject):
         Example:
             >>> manager.show_command_feedback("three two three")
         """
-        self.signals.command_feedback.emit(command)
+        self._emit_or_call(self.command_feedback, self._on_command_feedback, command)
+
+    def _emit_or_call(self, signal, slot, *args) -> None:
+        """Invoke the slot directly when already on the GUI thread.
+
+        The signal hop is only needed to marshal calls from the
+        recognition thread; for in-thread callers it's a pointless
+        dispatch round-trip.
+        """
+        if QThread.currentThread() is self.thread():
+            slot(*args)
+        else:
+            signal.emit(*args)
     
     def toggle_listening(self) -> None:
         """
@@ -374,22 +545,32 @@ class GUIManager(QObject):
         """
         if self.is_listening:
             self.set_paused()
-            self.signals.listening_toggled.emit(False)
+            self.listening_toggled.emit(False)
         else:
             self.set_listening()
-            self.signals.listening_toggled.emit(True)
-        logger.debug(f"Listening toggled: {self.is_listening}")
+            self.listening_toggled.emit(True)
+        logger.debug("Listening toggled: %s", self.is_listening)
     
+    def _ensure_settings_dialog(self) -> SettingsDialog:
+        """Build the settings dialog on first use.
+
+        Construction instantiates a full widget tree and reads every
+        setting, so it's deferred until the user actually opens it.
+        """
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self.config)
+            self.settings_dialog.settings_changed.connect(self._on_settings_changed)
+        return self.settings_dialog
+
     def show_settings(self) -> None:
         """
         Show settings dialog (modal).
-        
+
         Example:
             >>> manager.show_settings()
         """
-        if self.settings_dialog:
-            self.settings_dialog.exec()
-            logger.debug("Settings dialog shown")
+        self._ensure_settings_dialog().exec()
+        logger.debug("Settings dialog shown")
     
     def _on_status_changed(self, text: str) -> None:
         """Handle status change signal"""
@@ -398,19 +579,54 @@ class GUIManager(QObject):
             pass
     
     def _on_command_feedback(self, command: str) -> None:
-        """Handle command feedback signal"""
-        if self.use_modern_ui:
-            if self.modern_ui:
-                self.modern_ui.update_feedback(command, "success", "Recognized")
-        else:
-            if self.indicator:
-                self.indicator.update_command(command)
-    
+        """Handle command feedback signal.
+
+        Stores the command and (re)uses the pending 50ms window; only
+        the newest command in a window reaches the widget.
+        """
+        # Identical command already queued in this window: nothing to do
+        if command == self._pending_feedback:
+            return
+        self._pending_feedback = command
+        if not self._feedback_timer.isActive():
+            self._feedback_timer.start()
+
+    def _flush_feedback(self) -> None:
+        """Render the newest coalesced command feedback."""
+        command = self._pending_feedback
+        self._pending_feedback = None
+        if command is not None:
+            self._ui.update_feedback(command)
+    
+    def _refresh_settings_cache(self) -> None:
+        """Re-read the GUI settings this manager consults on hot paths."""
+        if not self.config:
+            return
+        self._cached_show_indicator = self.config.get("gui.show_floating_indicator", True)
+        self._cached_opacity = self.config.get("gui.indicator_opacity", 0.9)
+
     def _on_settings_changed(self, settings: Dict[str, Any]) -> None:
-        """Handle settings change from dialog"""
+        """Handle settings change from dialog.
+
+        Forwards only the keys whose values differ from the previous
+        payload - subscribers key off membership (e.g. main checking for
+        "keystroke_delay_ms"), so a diff spares them reconfiguring
+        subsystems whose settings didn't move, and PyQt marshals a
+        smaller dict across the signal.
+        """
+        snapshot = self._settings_snapshot
+        changed = {
+            key: value
+            for key, value in settings.items()
+            if snapshot.get(key, _UNSET) != value
+        }
+        snapshot.update(changed)
+
+        self._refresh_settings_cache()
         self._apply_settings()
-        self.signals.settings_changed.emit(settings)
-        logger.debug(f"Settings changed: {settings}")
+        if changed:
+            self.settings_changed.emit(changed)
+        logger.debug("Settings changed: %s", changed)
     
     def _apply_settings(self) -> None:
         """Apply current settings to GUI components"""
@@ -418,56 +634,89 @@ class GUIManager(QObject):
             return
         
         try:
-            # Apply opacity
-            opacity = self.config.get("gui.indicator_opacity", 0.9)
-            
-            if self.use_modern_ui:
-                if self.modern_ui:
-                    self.modern_ui.set_opacity(opacity)
-            else:
-                if self.indicator:
-                    self.indicator.set_opacity(opacity)
-            
-            # Show/hide indicator
-            show_indicator = self.config.get("gui.show_floating_indicator", True)
-            
-            if self.use_modern_ui:
-                if self.modern_ui:
-                    if show_indicator and self.is_visible:
-                        self.modern_ui.show()
-                    else:
-                        self.modern_ui.hide()
-            else:
-                if self.indicator:
-                    if show_indicator and self.is_visible:
-                        self.indicator.show()
-                    else:
-                        self.indicator.hide()
-            
+            # Apply opacity (cached - refreshed by _on_settings_changed)
+            # only when it actually differs from the window's current one
+            opacity = self._cached_opacity
+            if abs(self._ui.windowOpacity() - opacity) > 1e-3:
+                self._ui.set_opacity(opacity)
+
+            # Show/hide indicator - but show() on a visible widget still
+            # runs Qt's show-event path, so only act on real changes
+            should_show = self._cached_show_indicator and self.is_visible
+            if should_show and not self._ui.isVisible():
+                self._ui.show()
+            elif not should_show and self._ui.isVisible():
+                self._ui.hide()
+
             logger.debug("Settings applied to GUI components")
         
         except Exception as e:
             logger.error(f"Error applying settings: {e}")
     
-    def _on_update_timer(self) -> None:
-        """Periodic update handler"""
-        # Can be used for regular UI updates
-        pass
-    
+    def _tick(self) -> None:
+        """Shared timer slot: dispatch to whichever consumers are active."""
+        if self._session_ticking:
+            self._on_session_timer()
+        if self._update_ticking:
+            for callback in self._update_callbacks:
+                callback()
+
+    def _sync_shared_timer(self) -> None:
+        """Run the shared timer iff someone is consuming ticks."""
+        if self._session_ticking or self._update_ticking:
+            if not self.update_timer.isActive():
+                self.update_timer.start()
+        else:
+            self.update_timer.stop()
+
+    def register_update_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Subscribe a callable to the periodic update tick.
+
+        The first registration is what allows the update tick to run at
+        all - with no subscribers the timer fires for nobody, so it
+        doesn't fire.
+
+        Args:
+            callback: Zero-argument callable invoked once per tick
+        """
+        if callback not in self._update_callbacks:
+            self._update_callbacks.append(callback)
+
+    def unregister_update_callback(self, callback: Callable[[], None]) -> None:
+        """Remove a periodic update subscriber; stops ticking on the last."""
+        try:
+            self._update_callbacks.remove(callback)
+        except ValueError:
+            return
+        if not self._update_callbacks:
+            self._update_ticking = False
+            self._sync_shared_timer()
+
     def start_update_timer(self, interval_ms: int = 1000) -> None:
         """
         Start periodic update timer.
-        
+
+        No-op while no update callbacks are registered - a tick with
+        nothing to call is a pure wakeup.
+
         Args:
             interval_ms: Update interval in milliseconds
         """
+        if not self._update_callbacks:
+            logger.debug("Update timer not started - no callbacks registered")
+            return
+        # Shared with the session clock; a faster requested interval
+        # just means the session display refreshes more often too
         self.update_timer.setInterval(interval_ms)
-        self.update_timer.start()
-        logger.debug(f"Update timer started ({interval_ms}ms)")
-    
+        self._update_ticking = True
+        self._sync_shared_timer()
+        logger.debug("Update timer started (%dms)", interval_ms)
+
     def stop_update_timer(self) -> None:
         """Stop periodic update timer"""
-        self.update_timer.stop()
+        self._update_ticking = False
+        self._sync_shared_timer()
         logger.debug("Update timer stopped")
     
     def show_notification(self, title: str, message: str) -> None:
@@ -481,9 +730,16 @@ class GUIManager(QObject):
         Example:
             >>> manager.show_notification("Success", "Settings saved")
         """
+        # Emit rather than call: the queued connection hands the tray
+        # work to the GUI thread, so recognition-thread callers return
+        # immediately instead of blocking on the tray backend
+        self.notification_requested.emit(title, message)
+
+    def _on_notification_requested(self, title: str, message: str) -> None:
+        """Show the tray notification (always runs on the GUI thread)."""
         if self.tray:
             self.tray.show_message(title, message)
-            logger.debug(f"Notification: {title} - {message}")
+            logger.debug("Notification: %s - %s", title, message)
     
     def set_indicator_position(self, x: int, y: int) -> None:
         """
@@ -495,7 +751,7 @@ class GUIManager(QObject):
         """
         if self.indicator:
             self.indicator.set_position(x, y)
-            logger.debug(f"Indicator positioned at ({x}, {y})")
+            logger.debug("Indicator positioned at (%d, %d)", x, y)
     
     def get_indicator_position(self) -> tuple:
         """
@@ -512,24 +768,42 @@ class GUIManager(QObject):
         """
         Clean up resources before exit.
         
+        Idempotent: the exit path can reach here twice (exit signal plus
+        atexit), and the second pass must not push close events at an
+        already-draining event loop.
+
         Example:
             >>> manager.cleanup()
         """
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
+
         try:
             self.stop_update_timer()
             self.stop_session_timer()
-            
-            if self.use_modern_ui:
-                if self.modern_ui:
-                    self.modern_ui.close()
-            else:
-                if self.indicator:
-                    self.indicator.close()
-            
+            self._feedback_timer.stop()
+            self._disconnect_signals()
+
+            # Detach the visibility filter before closing, so teardown
+            # events don't route back into this half-dismantled manager
+            if self.modern_ui is not None:
+                self.modern_ui.removeEventFilter(self)
+
+            self._ui.close()
+
             if self.settings_dialog:
                 self.settings_dialog.close()
             if self.tray:
                 self.tray.hide()
+
+            # Drop component references so stray late calls hit the null
+            # UI / None guards instead of half-torn-down Qt objects
+            self._ui = _NullUI()
+            self.tray = None
+            self.indicator = None
+            self.modern_ui = None
+            self.settings_dialog = None
             logger.info("GUIManager cleanup completed")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -554,26 +828,75 @@ class GUIManager(QObject):
     
     def _on_session_timer(self) -> None:
         """Update session time on modern UI"""
-        self.session_time_seconds += 1
-        if self.use_modern_ui and self.modern_ui:
-            self.modern_ui.set_session_time(self.session_time_seconds)
-    
+        self._push_session_time()
+
+    def _push_session_time(self) -> None:
+        """Refresh the modern UI's session clock from wall-clock time.
+
+        Elapsed time is now - session start rather than a tick count, so
+        it stays correct across stretches where the display timer was
+        stopped (hidden UI).
+        """
+        if self._session_start is None or not self.modern_ui:
+            return
+        self.session_time_seconds = int(time.monotonic() - self._session_start)
+        self.modern_ui.set_session_time(self.session_time_seconds)
+
+    def eventFilter(self, obj, event) -> bool:
+        """Start/stop the session display timer with the UI's visibility.
+
+        A 1 Hz timer ticking into a hidden widget is pure wakeup cost -
+        3600 wakeups an hour for repaints nobody sees.
+
+        Qt can deliver events to an installed filter during teardown,
+        after the Python-side state is gone, and any exception escaping
+        a PyQt6 virtual override is fatal - so never assume instance
+        attributes exist here.
+        """
+        try:
+            if obj is getattr(self, 'modern_ui', None):
+                etype = event.type()
+                if etype == QEvent.Type.Show:
+                    if self._session_start is not None:
+                        self._push_session_time()
+                        self._session_ticking = True
+                        self._sync_shared_timer()
+                elif etype == QEvent.Type.Hide:
+                    self._session_ticking = False
+                    self._sync_shared_timer()
+        except Exception:
+            pass
+        return super().eventFilter(obj, event)
+
     def start_session_timer(self) -> None:
         """Start tracking session elapsed time"""
         self.session_time_seconds = 0
-        self.session_timer.setInterval(1000)
-        self.session_timer.start()
-    
+        self._session_start = time.monotonic()
+        # Only tick while the UI is visible; the event filter enables
+        # ticking on show otherwise
+        if self.modern_ui and self.modern_ui.isVisible():
+            self._session_ticking = True
+            self._sync_shared_timer()
+
     def stop_session_timer(self) -> None:
         """Stop tracking session elapsed time"""
-        self.session_timer.stop()
-    
+        self._session_start = None
+        self._session_ticking = False
+        self._sync_shared_timer()
+
     def set_field_counter(self, current: int, total: int) -> None:
         """Update field counter on modern UI"""
         if self.use_modern_ui and self.modern_ui:
             self.modern_ui.set_field_counter(current, total)
-    
+            self._push_session_time()
+
     def set_last_entry(self, entry: str) -> None:
         """Update last entry on modern UI"""
         if self.use_modern_ui and self.modern_ui:
             self.modern_ui.set_last_entry(entry)
+            self._push_session_time()
+
+
+# Backwards-compatible name for importers of the old signal holder class;
+# the signals are declared directly on GUIManager now
+GUIManagerSignals = GUIManager
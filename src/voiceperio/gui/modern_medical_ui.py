@@ -22,7 +22,7 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QScrollArea, QFrame
 )
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtGui import QFont, QColor, QPainter
 from typing import Optional, List
 from dataclasses import dataclass
 from datetime import datetime
@@ -58,7 +58,17 @@ class StatusIndicator(QWidget):
     - Sleeping (Gray #CCCCCC)
     - Ready (Blue #0066CC)
     """
-    
+
+    # Parsed once at class definition: the pulse animation repaints at
+    # full frame rate, and rebuilding this dict re-parsed four hex
+    # strings per frame
+    _COLORS = {
+        "listening": QColor("#4CAF50"),
+        "paused": QColor("#FF9800"),
+        "sleeping": QColor("#CCCCCC"),
+        "ready": QColor("#0066CC")
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.status = "ready"
@@ -92,22 +102,16 @@ class StatusIndicator(QWidget):
     
     def paintEvent(self, event):
         """Custom paint for animated circle"""
-        from PyQt6.QtGui import QPainter
-        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
+
         # Determine color based on status
-        colors = {
-            "listening": QColor("#4CAF50"),
-            "paused": QColor("#FF9800"),
-            "sleeping": QColor("#CCCCCC"),
-            "ready": QColor("#0066CC")
-        }
-        color = colors.get(self.status, QColor("#0066CC"))
-        
-        # Apply pulse opacity for listening state
+        color = self._COLORS.get(self.status, self._COLORS["ready"])
+
+        # Apply pulse opacity for listening state; copy first so the
+        # shared class-level instance is never mutated
         if self.status == "listening":
+            color = QColor(color)
             color.setAlphaF(self.pulse_value)
         
         # Draw circle with white border
@@ -378,7 +378,11 @@ class SettingsDialog(QDialog):
             
             # Hotkey settings
             self.config.set("hotkey.toggle_listening", self.toggle_hotkey_edit.text())
-            
+
+            # set() only arms the debounce timer; an explicit Save from
+            # the dialog should hit disk before the user moves on
+            self.config.flush()
+
             # Emit signal with changed settings
             settings = {
                 "tab_after_sequence": self.tab_after_check.isChecked(),
@@ -325,6 +325,9 @@ class TestGUIManager:
         assert result is True
         assert manager.tray is not None
         assert manager.indicator is not None
+        # Settings dialog is built lazily on first show_settings()
+        assert manager.settings_dialog is None
+        assert manager._ensure_settings_dialog() is not None
         assert manager.settings_dialog is not None
     
     def test_set_listening(self, temp_config):
@@ -469,12 +472,20 @@ class TestGUIManager:
         """Test update timer"""
         manager = GUIManager(temp_config)
         manager.setup()
-        
+
+        # Timer only runs when someone is subscribed to ticks
+        manager.start_update_timer(500)
+        assert not manager.update_timer.isActive()
+
+        callback = Mock()
+        manager.register_update_callback(callback)
         manager.start_update_timer(500)
         assert manager.update_timer.isActive()
-        
+
         manager.stop_update_timer()
         assert not manager.update_timer.isActive()
+
+        manager.unregister_update_callback(callback)
     
     def test_apply_settings(self, temp_config):
         """Test applying settings to components"""
@@ -523,8 +534,9 @@ class TestGUIIntegration:
         """Test settings dialog integration"""
         manager = GUIManager(temp_config)
         manager.setup()
-        
-        # Change settings
+
+        # Change settings (dialog is built lazily)
+        manager._ensure_settings_dialog()
         manager.settings_dialog.window_title_edit.setText("Eaglesoft")
         manager.settings_dialog.keystroke_slider.setValue(100)
         manager.settings_dialog.save_settings()
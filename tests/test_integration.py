@@ -66,10 +66,11 @@ class TestConfigManagerIntegration:
         config_path = tmp_path / "config.json"
         config = ConfigManager(str(config_path))
         
-        # Modify config
+        # Modify config; set() debounces, so flush before re-reading
         config.set("target.window_title", "TestWindow")
         config.set("behavior.tab_after_sequence", False)
-        
+        config.flush()
+
         # Create new instance to test loading
         config2 = ConfigManager(str(config_path))
         